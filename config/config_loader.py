@@ -1,16 +1,33 @@
 # config/config_loader.py
 
 import os
+import re
 import sys
-import dotenv
-from typing import Optional, Set, Dict, Any, List
-from dataclasses import dataclass
+import logging
+from types import MappingProxyType
+from typing import Optional, Set, Dict, Any, List, Tuple, Mapping, Callable
+from dataclasses import dataclass, field
 from logger import Logger
 
-# Load .env file at module import time
-dotenv.load_dotenv()
+# Accepted spellings of a true boolean setting (compared lower-cased)
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
 
-@dataclass(frozen=True)
+# Separator for comma-separated settings, absorbing surrounding whitespace
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    """Description of one configuration value read from the environment."""
+    env_var: str
+    prompt: str
+    valid_values: Optional[frozenset] = None
+    transform: Optional[Callable[[str], str]] = None
+    required: bool = False
+    default: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     """Immutable configuration data class with validation."""
     # API Configuration
@@ -19,8 +36,8 @@ class TradingConfig:
     
     # Trading Configuration
     mode: str
-    symbols: List[str]
-    timeframes: List[str]
+    symbols: Tuple[str, ...]
+    timeframes: Tuple[str, ...]
     history_count: int
     
     # Data Configuration
@@ -34,8 +51,19 @@ class TradingConfig:
     # Legacy support
     timeframe: Optional[str] = None
     
+    # Set views of symbols and timeframes for O(1) membership checks, derived in __post_init__
+    symbols_set: frozenset = field(init=False, repr=False, compare=False)
+    timeframes_set: frozenset = field(init=False, repr=False, compare=False)
+    
+    # Lazily built result of get_masked_secrets(); not part of the configuration itself
+    _masked_secrets: Optional[Mapping[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate configuration after initialization."""
+        # The dataclass is frozen, so derived fields are set past its __setattr__ guard
+        object.__setattr__(self, "symbols_set", frozenset(self.symbols))
+        object.__setattr__(self, "timeframes_set", frozenset(self.timeframes))
+        
         if self.mode not in ConfigLoader.VALID_MODES:
             raise ValueError(f"Mode must be one of {ConfigLoader.VALID_MODES}")
         
@@ -45,9 +73,9 @@ class TradingConfig:
                 raise ValueError("API credentials cannot be empty for live mode")
         
         # Validate timeframes
-        invalid_timeframes = [tf for tf in self.timeframes if tf not in ConfigLoader.VALID_TIMEFRAMES]
+        invalid_timeframes = self.timeframes_set.difference(ConfigLoader.VALID_TIMEFRAMES)
         if invalid_timeframes:
-            raise ValueError(f"Invalid timeframes {invalid_timeframes}. Valid: {list(ConfigLoader.VALID_TIMEFRAMES)}")
+            raise ValueError(f"Invalid timeframes {sorted(invalid_timeframes)}. Valid: {list(ConfigLoader.VALID_TIMEFRAMES)}")
         
         # Validate symbols
         if not self.symbols:
@@ -61,8 +89,15 @@ class TradingConfig:
         if self.cache_ttl < 0:
             raise ValueError("Cache TTL must be non-negative")
     
-    def get_masked_secrets(self) -> Dict[str, Any]:
-        """Return configuration with masked secrets for secure logging."""
+    def get_masked_secrets(self) -> Mapping[str, Any]:
+        """
+        Return configuration with masked secrets for secure logging.
+        
+        The mapping is built on first use and shared by later calls, so it is read-only.
+        """
+        if self._masked_secrets is not None:
+            return self._masked_secrets
+        
         result = {
             "mode": self.mode,
             "symbols": self.symbols,
@@ -81,7 +116,10 @@ class TradingConfig:
                 "api_secret": self._mask_secret(self.api_secret),
             })
         
-        return result
+        # The dataclass is frozen, so the cache is stored past its __setattr__ guard
+        masked = MappingProxyType(result)
+        object.__setattr__(self, "_masked_secrets", masked)
+        return masked
     
     @staticmethod
     def _mask_secret(secret: str) -> str:
@@ -94,39 +132,121 @@ class TradingConfig:
 class ConfigLoader:
     """Enhanced configuration loader for crypto trading application."""
     
+    __slots__ = ("logger", "interactive", "verbose_startup", "_config", "_env_snapshot", "_creds_valid")
+    
     # Use frozenset for immutable, efficient lookups
     VALID_MODES: Set[str] = frozenset({"backtest", "live", "data"})
     VALID_TIMEFRAMES: Set[str] = frozenset({"1m", "5m", "15m", "30m", "1h", "4h", "1d"})
     VALID_SYMBOLS: Set[str] = frozenset({"BTC", "ETH", "ADA", "DOT", "LINK", "UNI", "AAVE", "MATIC", "SOL", "AVAX"})
     VALID_LOG_LEVELS: Set[str] = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
     
+    # (prompt hint, error hint) for each valid-value set, sorted once at class load
+    _VALID_DISPLAY: Dict[frozenset, Tuple[str, str]] = {
+        vs: ("/".join(sorted(vs)), ", ".join(sorted(vs)))
+        for vs in (VALID_MODES, VALID_TIMEFRAMES, VALID_LOG_LEVELS)
+    }
+    
     # Default values
-    DEFAULT_SYMBOLS = ["BTC"]
-    DEFAULT_TIMEFRAMES = ["1m", "5m", "15m", "1h"]
+    DEFAULT_SYMBOLS: Tuple[str, ...] = ("BTC",)
+    DEFAULT_TIMEFRAMES: Tuple[str, ...] = ("1m", "5m", "15m", "1h")
     DEFAULT_HISTORY_COUNT = 1000
     DEFAULT_MAX_CANDLES = 2000
     DEFAULT_CACHE_TTL = 60
     DEFAULT_LOG_LEVEL = "INFO"
     DEFAULT_LOG_TO_FILE = True
     
-    def __init__(self, interactive: bool = True):
+    # Defaults in the string form they take in the environment
+    DEFAULT_SYMBOLS_CSV = ",".join(DEFAULT_SYMBOLS)
+    DEFAULT_TIMEFRAMES_CSV = ",".join(DEFAULT_TIMEFRAMES)
+    DEFAULT_HISTORY_COUNT_STR = str(DEFAULT_HISTORY_COUNT)
+    DEFAULT_MAX_CANDLES_STR = str(DEFAULT_MAX_CANDLES)
+    DEFAULT_CACHE_TTL_STR = str(DEFAULT_CACHE_TTL)
+    DEFAULT_LOG_TO_FILE_STR = str(DEFAULT_LOG_TO_FILE).lower()
+    
+    # Field tables driving _load_and_validate_config. MODE is read first because it
+    # decides whether the credential fields are needed at all
+    _MODE_FIELD = FieldSpec("MODE", "⚙️  Enter MODE", valid_values=VALID_MODES,
+                            transform=str.lower, required=True)
+    _CREDENTIAL_FIELDS: Tuple[FieldSpec, ...] = (
+        FieldSpec("API_KEY", "🔑 Enter API_KEY", required=True),
+        FieldSpec("API_SECRET", "🔐 Enter API_SECRET", required=True),
+    )
+    _SETTING_FIELDS: Tuple[FieldSpec, ...] = (
+        FieldSpec("SYMBOLS", "💰 Enter SYMBOLS (comma-separated)", default=DEFAULT_SYMBOLS_CSV),
+        FieldSpec("TIMEFRAMES", "📊 Enter TIMEFRAMES (comma-separated)", default=DEFAULT_TIMEFRAMES_CSV),
+        FieldSpec("HISTORY_COUNT", "📈 Enter HISTORY_COUNT", default=DEFAULT_HISTORY_COUNT_STR),
+        FieldSpec("MAX_CANDLES", "📊 Enter MAX_CANDLES", default=DEFAULT_MAX_CANDLES_STR),
+        FieldSpec("CACHE_TTL", "⏰ Enter CACHE_TTL (seconds)", default=DEFAULT_CACHE_TTL_STR),
+        FieldSpec("LOG_LEVEL", "📝 Enter LOG_LEVEL", valid_values=VALID_LOG_LEVELS,
+                  transform=str.upper, default=DEFAULT_LOG_LEVEL),
+        FieldSpec("LOG_TO_FILE", "📁 Log to file (true/false)", default=DEFAULT_LOG_TO_FILE_STR),
+    )
+    
+    # Emoji icon for each configuration key in the startup log
+    _ICONS: Mapping[str, str] = MappingProxyType({
+        "api_key": "🔑",
+        "api_secret": "🔐",
+        "mode": "⚙️ ",
+        "symbols": "💰",
+        "timeframes": "📊",
+        "history_count": "📈",
+        "max_candles": "📊",
+        "cache_ttl": "⏰",
+        "log_level": "📝",
+        "log_to_file": "📁"
+    })
+    
+    # Padded "<icon> <KEY>" label for each configuration key in the startup log
+    _CONFIG_LABELS: Mapping[str, str] = MappingProxyType({
+        key: f"{icon} {key.upper():<15}" for key, icon in _ICONS.items()
+    })
+    
+    # Whether the .env file has been loaded into os.environ in this process
+    _env_loaded: bool = False
+    
+    def __init__(self, interactive: bool = True, verbose_startup: bool = True):
         """
         Initialize ConfigLoader.
         
         Args:
             interactive: Whether to prompt user for missing values (default: True)
+            verbose_startup: Whether to log every loaded setting (default: True)
         """
-        self.logger = Logger(__name__, log_to_file=True)
+        # File logging is attached once the config says it is wanted, so error and
+        # cancel paths never open the log file
+        self.logger = Logger(__name__, log_to_file=False)
         self.interactive = interactive
+        self.verbose_startup = verbose_startup
         self._config: Optional[TradingConfig] = None
         
+        # Result of validate_api_credentials() for the current config
+        self._creds_valid: Optional[bool] = None
+        
+        self._ensure_env_loaded()
+        
+        # Snapshot of the environment read by this loader, so every field of a load
+        # sees the same values even if os.environ changes concurrently
+        self._env_snapshot: Dict[str, str] = dict(os.environ)
+        
         try:
             self._config = self._load_and_validate_config()
-            self._log_configuration()
+            self._configure_file_logging()
+            if self.verbose_startup:
+                self._log_configuration()
             
         except (ValueError, KeyboardInterrupt) as e:
             self._handle_configuration_error(e)
     
+    @classmethod
+    def _ensure_env_loaded(cls) -> None:
+        """Load the .env file on first use instead of at module import time."""
+        if cls._env_loaded:
+            return
+        
+        import dotenv
+        dotenv.load_dotenv()
+        cls._env_loaded = True
+    
     @property
     def config(self) -> TradingConfig:
         """Get the validated configuration."""
@@ -139,128 +259,185 @@ class ConfigLoader:
         self.logger.info("🔧 Loading trading configuration...")
         
         # Load MODE first - always required
-        mode = self._get_config_value("MODE", "⚙️  Enter MODE", 
-                                    valid_values=self.VALID_MODES,
-                                    transform=str.lower,
-                                    required=True)
-        
-        # Initialize API credentials
-        api_key = ""
-        api_secret = ""
+        mode = self._get_config_values((self._MODE_FIELD,))["MODE"]
         
         # Only get API credentials for live mode
+        specs = self._SETTING_FIELDS
         if mode == "live":
-            api_key = self._get_config_value("API_KEY", "🔑 Enter API_KEY", required=True)
-            api_secret = self._get_config_value("API_SECRET", "🔐 Enter API_SECRET", required=True)
+            specs = self._CREDENTIAL_FIELDS + specs
+        raw = self._get_config_values(specs)
         
-        # Load symbols - comma-separated list
-        symbols_str = self._get_config_value("SYMBOLS", "💰 Enter SYMBOLS (comma-separated)", 
-                                           required=False, default=",".join(self.DEFAULT_SYMBOLS))
-        symbols = [s.strip().upper() for s in symbols_str.split(",") if s.strip()]
+        api_key = raw.get("API_KEY", "")
+        api_secret = raw.get("API_SECRET", "")
+        
+        # Parse symbols - comma-separated list
+        symbols = self._dedupe([s for s in _CSV_SPLIT.split(raw["SYMBOLS"].strip().upper()) if s], "symbols")
         
         # Validate symbols
-        invalid_symbols = [s for s in symbols if s not in self.VALID_SYMBOLS]
+        invalid_symbols = set(symbols).difference(self.VALID_SYMBOLS)
         if invalid_symbols:
-            self.logger.warning(f"⚠️  Unknown symbols: {invalid_symbols}. Proceeding anyway...")
-        
-        # Load timeframes - comma-separated list
-        timeframes_str = self._get_config_value("TIMEFRAMES", "📊 Enter TIMEFRAMES (comma-separated)",
-                                              required=False, default=",".join(self.DEFAULT_TIMEFRAMES))
-        timeframes = [t.strip().lower() for t in timeframes_str.split(",") if t.strip()]
-        
-        # Load numeric configurations
-        history_count = int(self._get_config_value("HISTORY_COUNT", "📈 Enter HISTORY_COUNT",
-                                                 required=False, default=str(self.DEFAULT_HISTORY_COUNT)))
-        
-        max_candles = int(self._get_config_value("MAX_CANDLES", "📊 Enter MAX_CANDLES", 
-                                               required=False, default=str(self.DEFAULT_MAX_CANDLES)))
-        
-        cache_ttl = int(self._get_config_value("CACHE_TTL", "⏰ Enter CACHE_TTL (seconds)",
-                                             required=False, default=str(self.DEFAULT_CACHE_TTL)))
-        
-        # Load logging configuration
-        log_level = self._get_config_value("LOG_LEVEL", "📝 Enter LOG_LEVEL",
-                                         valid_values=self.VALID_LOG_LEVELS,
-                                         transform=str.upper,
-                                         required=False, default=self.DEFAULT_LOG_LEVEL)
-        
-        log_to_file_str = self._get_config_value("LOG_TO_FILE", "📁 Log to file (true/false)",
-                                                required=False, default="true")
-        log_to_file = log_to_file_str.lower() in ("true", "1", "yes", "on")
-        
-        return TradingConfig(
-            api_key=api_key,
-            api_secret=api_secret,
-            mode=mode,
-            symbols=symbols,
-            timeframes=timeframes,
-            history_count=history_count,
-            max_candles=max_candles,
-            cache_ttl=cache_ttl,
-            log_level=log_level,
-            log_to_file=log_to_file
-        )
-    
-    def _get_config_value(self,
-                         env_var: str,
-                         prompt: str,
-                         valid_values: Optional[Set[str]] = None,
-                         transform: Optional[callable] = None,
-                         required: bool = False,
-                         default: Optional[str] = None) -> str:
+            self.logger.warning(f"⚠️  Unknown symbols: {sorted(invalid_symbols)}. Proceeding anyway...")
+        
+        # Parse timeframes - comma-separated list
+        timeframes = self._dedupe([t for t in _CSV_SPLIT.split(raw["TIMEFRAMES"].strip().lower()) if t],
+                                  "timeframes")
+        
+        # Parse numeric configurations
+        history_count = int(raw["HISTORY_COUNT"])
+        max_candles = int(raw["MAX_CANDLES"])
+        cache_ttl = int(raw["CACHE_TTL"])
+        
+        # Parse logging configuration
+        log_level = raw["LOG_LEVEL"]
+        log_to_file = raw["LOG_TO_FILE"].lower() in _TRUTHY_VALUES
+        
+        values = {
+            "api_key": api_key,
+            "api_secret": api_secret,
+            "mode": mode,
+            "symbols": tuple(symbols),
+            "timeframes": tuple(timeframes),
+            "history_count": history_count,
+            "max_candles": max_candles,
+            "cache_ttl": cache_ttl,
+            "log_level": log_level,
+            "log_to_file": log_to_file
+        }
+        
+        # A reload that yields the same values keeps the already validated config
+        current = self._config
+        if current is not None and all(getattr(current, name) == value for name, value in values.items()):
+            return current
+        
+        return TradingConfig(**values)
+    
+    def _dedupe(self, items: List[str], label: str) -> List[str]:
         """
-        Get configuration value from environment or user input with validation.
+        Drop repeated entries from a configured list, keeping first-seen order.
         
         Args:
-            env_var: Environment variable name
-            prompt: User prompt message
-            valid_values: Set of valid values for validation
-            transform: Function to transform the input value
-            required: Whether the value is required
-            default: Default value to use if not found and not required
+            items: Parsed list values
+            label: Name of the setting, used in the warning
             
         Returns:
-            The validated configuration value
+            The list without duplicates
+        """
+        deduped = list(dict.fromkeys(items))
+        if len(deduped) != len(items):
+            duplicates = sorted({item for item in items if items.count(item) > 1})
+            self.logger.warning(f"⚠️  Dropping duplicate {label}: {duplicates}")
+        return deduped
+    
+    def _get_config_values(self, specs: Tuple[FieldSpec, ...]) -> Dict[str, str]:
+        """
+        Get several configuration values from the environment or user input.
+        
+        In non-interactive mode every field is resolved and validated exactly once,
+        and all problems are reported together.
+        
+        Args:
+            specs: Fields to load
+            
+        Returns:
+            Mapping of environment variable name to validated value
             
         Raises:
-            ValueError: If required value is missing or invalid
+            ValueError: If any required value is missing or invalid
         """
-        value = os.getenv(env_var)
+        if self.interactive:
+            return {spec.env_var: self._get_config_value(spec) for spec in specs}
+        
+        values: Dict[str, str] = {}
+        errors: List[str] = []
+        for spec in specs:
+            value = self._resolve_value(spec)
+            if self._is_valid_value(value, spec.valid_values, spec.required):
+                values[spec.env_var] = value
+            else:
+                errors.append(self._invalid_value_message(spec))
+        
+        if errors:
+            raise ValueError("; ".join(errors))
+        return values
+    
+    def _raw_value(self, spec: FieldSpec) -> Optional[str]:
+        """Read a field from the environment snapshot, falling back to its default."""
+        value = self._env_snapshot.get(spec.env_var)
         
         # Use default if no value found and not required
-        if not value and not required and default:
-            value = default
+        if not value and not spec.required and spec.default:
+            value = spec.default
+        
+        return value
+    
+    def _resolve_value(self, spec: FieldSpec) -> Optional[str]:
+        """Read a field from the environment snapshot, applying its default and transform."""
+        value = self._raw_value(spec)
         
         # Transform value if transformer provided
-        if value and transform:
-            value = transform(value)
+        if value and spec.transform:
+            value = spec.transform(value)
+        
+        return value
+    
+    def _valid_display(self, valid_values: frozenset) -> Tuple[str, str]:
+        """Get the (prompt hint, error hint) strings for a set of valid values."""
+        display = self._VALID_DISPLAY.get(valid_values)
+        if display is None:
+            ordered = sorted(valid_values)
+            display = ("/".join(ordered), ", ".join(ordered))
+        return display
+    
+    def _invalid_value_message(self, spec: FieldSpec) -> str:
+        """Build the error message for a missing or invalid field."""
+        error_msg = f"Missing or invalid {spec.env_var}"
+        if spec.valid_values:
+            error_msg += f". Expected one of: {self._valid_display(spec.valid_values)[1]}"
+        return error_msg
+    
+    def _get_config_value(self, spec: FieldSpec) -> str:
+        """
+        Get configuration value from environment or user input with validation.
         
-        # Check if value is valid
-        while not self._is_valid_value(value, valid_values, required):
+        Args:
+            spec: Field to load
+            
+        Returns:
+            The validated configuration value
+            
+        Raises:
+            ValueError: If required value is missing or invalid
+        """
+        value = self._raw_value(spec)
+        
+        # Hint for the valid values, resolved once for the whole retry loop
+        choices = self._valid_display(spec.valid_values)[0] if spec.valid_values else None
+        
+        while True:
+            # Every candidate (environment, default or user input) is transformed here
+            if spec.transform and value:
+                value = spec.transform(value)
+            
+            # Check if value is valid
+            if self._is_valid_value(value, spec.valid_values, spec.required):
+                return value
+            
             if not self.interactive:
-                error_msg = f"Missing or invalid {env_var}"
-                if valid_values:
-                    error_msg += f". Expected one of: {', '.join(sorted(valid_values))}"
-                raise ValueError(error_msg)
+                raise ValueError(self._invalid_value_message(spec))
             
             # Show current default if available
-            prompt_text = prompt
-            if default and not required:
-                prompt_text += f" (default: {default})"
+            prompt_text = spec.prompt
+            if spec.default and not spec.required:
+                prompt_text += f" (default: {spec.default})"
             
             # Prompt user for input
-            user_input = self._prompt_user_input(prompt_text, valid_values)
+            user_input = self._prompt_user_input(prompt_text, choices)
             
             # Use default if user provides empty input and default exists
-            if not user_input and default and not required:
-                value = default
+            if not user_input and spec.default and not spec.required:
+                value = spec.default
             else:
                 value = user_input
-                
-            if transform and value:
-                value = transform(value)
-        
-        return value
     
     def _is_valid_value(self, value: Optional[str], valid_values: Optional[Set[str]], required: bool) -> bool:
         """Check if a value is valid according to the criteria."""
@@ -270,11 +447,11 @@ class ConfigLoader:
             return False
         return True
     
-    def _prompt_user_input(self, prompt: str, valid_values: Optional[Set[str]]) -> str:
+    def _prompt_user_input(self, prompt: str, choices: Optional[str]) -> str:
         """Prompt user for input with validation hints."""
         try:
-            if valid_values:
-                full_prompt = f"{prompt} ({'/'.join(sorted(valid_values))}): "
+            if choices:
+                full_prompt = f"{prompt} ({choices}): "
             else:
                 full_prompt = f"{prompt}: "
             
@@ -283,36 +460,36 @@ class ConfigLoader:
         except (EOFError, KeyboardInterrupt):
             raise KeyboardInterrupt("Configuration cancelled by user")
     
+    def _configure_file_logging(self) -> None:
+        """Attach the file handler to this loader's logger if the config enables it."""
+        if not self._config or not self._config.log_to_file:
+            return
+        if any(isinstance(handler, logging.FileHandler) for handler in Logger.get_handlers(__name__)):
+            return
+        
+        Logger.remove_logger(__name__)
+        self.logger = Logger(__name__, log_to_file=True)
+    
     def _log_configuration(self) -> None:
         """Log the configuration with masked secrets."""
-        if not self._config:
+        if not self._config or not self.logger.isEnabledFor(logging.INFO):
             return
         
         self.logger.info("✅ Configuration loaded successfully:")
         masked_config = self._config.get_masked_secrets()
         
         for key, value in masked_config.items():
-            icon = self._get_config_icon(key)
-            if isinstance(value, list):
+            label = self._CONFIG_LABELS.get(key)
+            if label is None:
+                label = f"{self._get_config_icon(key)} {key.upper():<15}"
+            if isinstance(value, (list, tuple)):
                 value = ", ".join(str(v) for v in value)
-            self.logger.info(f"{icon} {key.upper():<15} = {value}")
+            self.logger.info(f"{label} = {value}")
     
     @staticmethod
     def _get_config_icon(key: str) -> str:
         """Get appropriate emoji icon for configuration key."""
-        icons = {
-            "api_key": "🔑",
-            "api_secret": "🔐",
-            "mode": "⚙️ ",
-            "symbols": "💰",
-            "timeframes": "📊",
-            "history_count": "📈",
-            "max_candles": "📊",
-            "cache_ttl": "⏰",
-            "log_level": "📝",
-            "log_to_file": "📁"
-        }
-        return icons.get(key, "🔧")
+        return ConfigLoader._ICONS.get(key, "🔧")
     
     def _handle_configuration_error(self, error: Exception) -> None:
         """Handle configuration errors appropriately."""
@@ -329,8 +506,12 @@ class ConfigLoader:
         """Reload configuration from environment variables."""
         try:
             self.logger.info("🔄 Reloading configuration...")
+            self._creds_valid = None
+            self._env_snapshot = dict(os.environ)
             self._config = self._load_and_validate_config()
-            self._log_configuration()
+            self._configure_file_logging()
+            if self.verbose_startup:
+                self._log_configuration()
             self.logger.info("✅ Configuration reloaded successfully")
             
         except (ValueError, KeyboardInterrupt) as e:
@@ -346,9 +527,14 @@ class ConfigLoader:
         if not self._config:
             return False
         
+        # Credentials only change on reload(), which clears the cached result
+        if self._creds_valid is not None:
+            return self._creds_valid
+        
         # Skip validation for non-live modes
         if self._config.mode != "live":
             self.logger.info(f"📊 {self._config.mode.title()} mode - API credentials not required")
+            self._creds_valid = True
             return True
         
         # Basic validation for live mode
@@ -356,4 +542,5 @@ class ConfigLoader:
         api_secret_valid = len(self._config.api_secret) >= 8
         
         self.logger.info(f"🔐 API credentials format validation: {'✅' if api_key_valid and api_secret_valid else '❌'}")
-        return api_key_valid and api_secret_valid
+        self._creds_valid = api_key_valid and api_secret_valid
+        return self._creds_valid
@@ -1,12 +1,195 @@
 # logger.py
 
+import atexit
 import logging
 import os
+import re
 import sys
 import threading
-from logging.handlers import RotatingFileHandler
+import time
+import weakref
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Optional, Dict, Union, List
 
+# Emoji (pictographs, symbols, dingbats) with an optional variation selector and
+# the spacing that follows them; kept on the console, dropped from log files
+_EMOJI_RE = re.compile(r"[\U0001F300-\U0001FAFF\u2300-\u23FF\u2600-\u27BF]\uFE0F? *")
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    Only the message arguments are merged on the calling thread, so mutable
+    arguments are captured as they were at the call; timestamps, level names
+    and tracebacks are formatted by the real handlers behind the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _DispatchHandler(logging.Handler):
+    """Listener-side handler routing each record to the handlers of its logger."""
+
+    def __init__(self, handlers: Dict[str, List[logging.Handler]]):
+        super().__init__()
+        self._handlers = handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self._handlers.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the timestamp at most once per second.
+
+    With a second-resolution datefmt, every record within the same second gets
+    the same string, so the strftime result is reused until the second changes.
+    """
+
+    _cached_time = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            # The default format includes milliseconds
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached = self._cached_time
+        if cached[0] == second:
+            return cached[1]
+
+        formatted = time.strftime(datefmt, self.converter(record.created))
+        self._cached_time = (second, formatted)
+        return formatted
+
+
+class _StripEmojiFormatter(_CachedTimeFormatter):
+    """File formatter that drops emoji, which cost 3-4 UTF-8 bytes each on disk."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return _EMOJI_RE.sub("", super().format(record))
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size instead of seeking per record.
+
+    The stock handler formats every record twice and seeks to the end of the
+    file to decide on rollover. This one formats once and keeps an upper bound
+    of the file size (4 bytes per character, the UTF-8 maximum); the real size
+    is only read back once that bound gets close to maxBytes.
+
+    Writes go through a buffer of buffer_size bytes that is flushed right away
+    for ERROR and above, and otherwise at most flush_interval seconds after a
+    record was written. One background thread flushes all open handlers.
+    """
+
+    _is_real_file = True
+    _size_bound = 0
+
+    flush_interval = 30.0
+
+    # Open handlers, and the one thread flushing all of them with its stop event
+    _open_handlers: "weakref.WeakSet[_FastRotatingFileHandler]" = weakref.WeakSet()
+    _flush_thread: Optional[threading.Thread] = None
+    _flush_stop: Optional[threading.Event] = None
+    _flush_thread_lock = threading.Lock()
+
+    def __init__(self, *args, buffer_size: int = 64 * 1024, **kwargs):
+        self.buffer_size = buffer_size
+        self._dirty = False
+        super().__init__(*args, **kwargs)
+
+        _FastRotatingFileHandler._open_handlers.add(self)
+        self.start_flushing()
+
+    @classmethod
+    def start_flushing(cls) -> None:
+        """Start the timed flush thread if it is not running."""
+        with cls._flush_thread_lock:
+            if cls._flush_thread is None:
+                cls._flush_stop = threading.Event()
+                cls._flush_thread = threading.Thread(
+                    target=cls._flush_loop, args=(cls._flush_stop,), name="log-flush", daemon=True
+                )
+                cls._flush_thread.start()
+
+    @classmethod
+    def stop_flushing(cls) -> None:
+        """Stop the timed flush thread and wait for it to exit."""
+        with cls._flush_thread_lock:
+            thread, cls._flush_thread = cls._flush_thread, None
+            if thread is not None:
+                cls._flush_stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    @classmethod
+    def _flush_loop(cls, stop: threading.Event) -> None:
+        while not stop.wait(cls.flush_interval):
+            for handler in list(cls._open_handlers):
+                if handler._dirty:
+                    handler.flush()
+
+    def flush(self) -> None:
+        self._dirty = False
+        super().flush()
+
+    def close(self) -> None:
+        _FastRotatingFileHandler._open_handlers.discard(self)
+        super().close()
+
+    def _open(self):
+        stream = self._builtin_open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+        # Rotating e.g. /dev/null makes no sense; decided once per open file
+        self._is_real_file = os.path.isfile(self.baseFilename)
+        self._size_bound = stream.seek(0, 2)
+        return stream
+
+    def _needs_rollover(self, length: int) -> bool:
+        if self.maxBytes <= 0 or not self._is_real_file:
+            return False
+        if self._size_bound + 4 * length < self.maxBytes:
+            return False
+        self._size_bound = self.stream.seek(0, 2)
+        return self._size_bound + length >= self.maxBytes
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._needs_rollover(len(self.format(record)) + 1)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._needs_rollover(len(msg)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size_bound += 4 * len(msg)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            else:
+                self._dirty = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 class Logger:
     _loggers: Dict[str, logging.Logger] = {}
@@ -14,17 +197,54 @@ class Logger:
     _default_log_dir = "logs"
     _default_log_file = "trader.log"
     _default_formatter = None
+    _file_formatter = None
+
+    # File handlers per logger name, run by one background listener so callers
+    # only pay for an enqueue; console output stays on the calling thread so it
+    # keeps its order with the program's own prints
+    _handlers: Dict[str, List[logging.Handler]] = {}
+
+    # One file handler per log file path, shared by every logger writing to it so
+    # that records reach the file in logging order and rotate together
+    _file_handlers: Dict[str, logging.Handler] = {}
+    _queue: SimpleQueue = SimpleQueue()
+    _listener: Optional[QueueListener] = None
 
     @classmethod
     def _get_default_formatter(cls) -> logging.Formatter:
         """Get or create the default formatter (singleton pattern)."""
         if cls._default_formatter is None:
-            cls._default_formatter = logging.Formatter(
+            cls._default_formatter = _CachedTimeFormatter(
                 fmt="%(asctime)s [%(module)s::%(name)s] %(levelname)-8s %(message)s",
                 datefmt="%Y-%m-%dT%H:%M:%S%z"  # ISO 8601 format
             )
         return cls._default_formatter
 
+    @classmethod
+    def _get_file_formatter(cls) -> logging.Formatter:
+        """Get or create the log file formatter, the default format without emoji."""
+        if cls._file_formatter is None:
+            default = cls._get_default_formatter()
+            cls._file_formatter = _StripEmojiFormatter(fmt=default._fmt, datefmt=default.datefmt)
+        return cls._file_formatter
+
+    @classmethod
+    def _start_listener(cls) -> None:
+        """Start the background listener and file flushing if not running (caller holds the lock)."""
+        if cls._listener is None:
+            cls._listener = QueueListener(cls._queue, _DispatchHandler(cls._handlers))
+            cls._listener.start()
+        if cls._file_handlers:
+            _FastRotatingFileHandler.start_flushing()
+
+    @classmethod
+    def _stop_listener(cls) -> None:
+        """Write out all queued records and stop the listener and flush threads."""
+        listener, cls._listener = cls._listener, None
+        if listener is not None:
+            listener.stop()
+        _FastRotatingFileHandler.stop_flushing()
+
     def __new__(
         cls,
         name: str,
@@ -38,6 +258,9 @@ class Logger:
         """
         Create or retrieve a logger instance.
         
+        Console output is written on the calling thread; file records are handed
+        to a queue and formatted and written on a shared background thread.
+        
         Args:
             name: Logger name
             level: Logging level
@@ -49,6 +272,11 @@ class Logger:
         Returns:
             Logger instance
         """
+        # Fast path: existing loggers are returned without taking the lock
+        cached = cls._loggers.get(name)
+        if cached is not None:
+            return cached
+
         with cls._lock:  # Thread-safe singleton
             if name in cls._loggers:
                 return cls._loggers[name]
@@ -58,6 +286,7 @@ class Logger:
             logger.propagate = False  # Prevent duplicate logs from root logger
 
             formatter = cls._get_default_formatter()
+            handlers: List[logging.Handler] = []
 
             if log_to_console:
                 console_handler = logging.StreamHandler(sys.stdout)
@@ -74,16 +303,29 @@ class Logger:
                     # Use provided path
                     file_path = log_to_file
                 
-                cls._ensure_log_path_exists(file_path)
-                file_handler = RotatingFileHandler(
-                    file_path, 
-                    maxBytes=max_bytes, 
-                    backupCount=backup_count, 
-                    encoding="utf-8"
-                )
-                file_handler.setLevel(level)
-                file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                # The first logger on a path sets its rotation limits; a shared
+                # handler passes the lowest level of the loggers using it
+                file_key = os.path.abspath(file_path)
+                file_handler = cls._file_handlers.get(file_key)
+                if file_handler is None:
+                    cls._ensure_log_path_exists(file_path)
+                    file_handler = _FastRotatingFileHandler(
+                        file_path, 
+                        maxBytes=max_bytes, 
+                        backupCount=backup_count, 
+                        encoding="utf-8"
+                    )
+                    file_handler.setLevel(level)
+                    file_handler.setFormatter(cls._get_file_formatter())
+                    cls._file_handlers[file_key] = file_handler
+                elif level < file_handler.level:
+                    file_handler.setLevel(level)
+                handlers.append(file_handler)
+
+            if handlers:
+                cls._handlers[name] = handlers
+                cls._start_listener()
+                logger.addHandler(_DeferredQueueHandler(cls._queue))
 
             cls._loggers[name] = logger
             return logger
@@ -99,6 +341,15 @@ class Logger:
         """Get an existing logger by name."""
         return cls._loggers.get(name)
 
+    @classmethod
+    def get_handlers(cls, name: str) -> List[logging.Handler]:
+        """Get the console/file handlers writing a logger's records."""
+        logger = cls._loggers.get(name)
+        if logger is None:
+            return []
+        console = [handler for handler in logger.handlers if not isinstance(handler, QueueHandler)]
+        return console + cls._handlers.get(name, [])
+
     @classmethod
     def remove_logger(cls, name: str) -> bool:
         """
@@ -111,16 +362,37 @@ class Logger:
             True if logger was removed, False if it didn't exist
         """
         with cls._lock:
-            if name in cls._loggers:
-                logger = cls._loggers[name]
-                # Clean up handlers
-                for handler in logger.handlers[:]:
-                    handler.close()
-                    logger.removeHandler(handler)
-                del cls._loggers[name]
-                return True
+            return cls._remove_logger(name)
+
+    @classmethod
+    def _remove_logger(cls, name: str) -> bool:
+        """Remove a logger and its handlers (caller holds the lock)."""
+        if name not in cls._loggers:
             return False
 
+        logger = cls._loggers.pop(name)
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+        if name in cls._handlers:
+            # Write out records still queued for these handlers before closing them
+            running = cls._listener is not None
+            cls._stop_listener()
+            for handler in cls._handlers.pop(name):
+                if not any(handler in others for others in cls._handlers.values()):
+                    cls._close_handler(handler)
+            if running:
+                cls._start_listener()
+        return True
+
+    @classmethod
+    def _close_handler(cls, handler: logging.Handler) -> None:
+        """Close a handler no logger uses any more (caller holds the lock)."""
+        if isinstance(handler, logging.FileHandler):
+            cls._file_handlers.pop(handler.baseFilename, None)
+        handler.close()
+
     @classmethod
     def list_loggers(cls) -> List[str]:
         """Get a list of all active logger names."""
@@ -130,5 +402,10 @@ class Logger:
     def cleanup_all(cls) -> None:
         """Clean up all loggers and their handlers."""
         with cls._lock:
+            cls._stop_listener()
             for name in list(cls._loggers.keys()):
-                cls.remove_logger(name)
+                cls._remove_logger(name)
+
+
+# Flush queued records when the interpreter exits
+atexit.register(Logger._stop_listener)
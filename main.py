@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import sys
-from utils.data_stream import DataStream
 from config.config_loader import ConfigLoader
 
 
@@ -22,17 +21,22 @@ def main():
         sys.exit(1)
     
     # Override symbol from command line if provided
-    symbols = config.symbols.copy()
+    symbols = list(config.symbols)
+    timeframes = config.timeframes
+    history_count = config.history_count
     if len(sys.argv) > 1:
         symbol_arg = sys.argv[1].upper()
         print(f"🔄 Overriding symbols with command line argument: {symbol_arg}")
         symbols = [symbol_arg]
     
     print(f"\n🎯 Target symbols: {', '.join(symbols)}")
-    print(f"📊 Timeframes: {', '.join(config.timeframes)}")
-    print(f"� History count: {config.history_count}")
+    print(f"📊 Timeframes: {', '.join(timeframes)}")
+    print(f"� History count: {history_count}")
     
-    # Create DataStream and load symbol data
+    # Create DataStream and load symbol data. Imported here so a configuration
+    # error exits without loading polars and the data ingestion stack
+    import polars as pl
+    from utils.data_stream import DataStream
     data_stream = DataStream()
     
     try:
@@ -43,56 +47,67 @@ def main():
             print(f"{'='*60}")
             
             # Load historical data for multiple timeframes
-            if data_stream.load_symbol(symbol, timeframes=config.timeframes, history_count=config.history_count):
-                print(f"\n✅ Successfully loaded data for {symbol}")
+            if data_stream.load_symbol(symbol, timeframes=timeframes, history_count=history_count):
+                # Collect the report and write it in one go instead of one print per line
+                lines = [f"\n✅ Successfully loaded data for {symbol}"]
                 
                 # Display summary for each timeframe
-                for timeframe in config.timeframes:
+                volatilities = {}
+                for timeframe in timeframes:
                     df = data_stream.get_data(symbol, timeframe)
-                    if df is not None:
-                        latest_candle = data_stream.get_latest_candle(symbol, timeframe)
+                    if df is not None and len(df) > 0:
+                        # All summary statistics in one query over the frame
+                        stats = df.select(
+                            pl.col('low').min().alias('low_min'),
+                            pl.col('high').max().alias('high_max'),
+                            pl.col('volume').min().alias('volume_min'),
+                            pl.col('volume').max().alias('volume_max'),
+                            pl.col('timestamp').min().alias('timestamp_min'),
+                            pl.col('timestamp').max().alias('timestamp_max'),
+                            pl.col('close').first().alias('close_first'),
+                            pl.col('close').last().alias('close_last'),
+                            pl.col('close').std().alias('close_std'),
+                        ).row(0, named=True)
                         
-                        print(f"\n📊 {timeframe.upper()} Timeframe:")
-                        print(f"   • Candles loaded: {len(df):,}")
-                        print(f"   • Latest price: ${latest_candle['close']:.2f}")
-                        print(f"   • Price range: ${df['low'].min():.2f} - ${df['high'].max():.2f}")
-                        print(f"   • Volume range: {df['volume'].min():.0f} - {df['volume'].max():.0f}")
-                        print(f"   • Data from: {df['timestamp'].min()} to {df['timestamp'].max()}")
+                        lines.append(f"\n📊 {timeframe.upper()} Timeframe:")
+                        lines.append(f"   • Candles loaded: {len(df):,}")
+                        lines.append(f"   • Latest price: ${stats['close_last']:.2f}")
+                        lines.append(f"   • Price range: ${stats['low_min']:.2f} - ${stats['high_max']:.2f}")
+                        lines.append(f"   • Volume range: {stats['volume_min']:.0f} - {stats['volume_max']:.0f}")
+                        lines.append(f"   • Data from: {stats['timestamp_min']} to {stats['timestamp_max']}")
                         
                         # Calculate basic metrics
-                        price_change = latest_candle['close'] - df['close'][0]
-                        price_change_pct = (price_change / df['close'][0]) * 100
-                        volatility = df['close'].std()
+                        price_change = stats['close_last'] - stats['close_first']
+                        price_change_pct = (price_change / stats['close_first']) * 100
+                        volatility = stats['close_std']
+                        volatilities[timeframe] = volatility
                         
-                        print(f"   • Price change: ${price_change:+.2f} ({price_change_pct:+.2f}%)")
-                        print(f"   • Volatility (σ): ${volatility:.2f}")
+                        lines.append(f"   • Price change: ${price_change:+.2f} ({price_change_pct:+.2f}%)")
+                        lines.append(f"   • Volatility (σ): ${volatility:.2f}")
                     else:
-                        print(f"\n❌ No data available for {symbol} {timeframe}")
+                        lines.append(f"\n❌ No data available for {symbol} {timeframe}")
                 
                 # Show which timeframes were successfully loaded
                 loaded_timeframes = data_stream.get_loaded_timeframes(symbol)
-                print(f"\n📈 Successfully loaded timeframes: {', '.join(loaded_timeframes)}")
+                lines.append(f"\n📈 Successfully loaded timeframes: {', '.join(loaded_timeframes)}")
                 
                 # Summary statistics
                 if loaded_timeframes:
-                    print(f"\n📊 Summary for {symbol}:")
-                    all_data = data_stream.get_all_data(symbol)
+                    lines.append(f"\n📊 Summary for {symbol}:")
                     
-                    print(f"   • Total timeframes loaded: {len(loaded_timeframes)}")
-                    total_candles = sum(len(df) for df in all_data.values())
-                    print(f"   • Total candles across all timeframes: {total_candles:,}")
-                    
-                    # Find most volatile timeframe
-                    volatilities = {}
-                    for tf in loaded_timeframes:
-                        df = all_data[tf]
-                        volatilities[tf] = df['close'].std()
+                    lines.append(f"   • Total timeframes loaded: {len(loaded_timeframes)}")
+                    total_candles = data_stream.get_total_candles(symbol)
+                    lines.append(f"   • Total candles across all timeframes: {total_candles:,}")
                     
+                    # Find most volatile timeframe (standard deviations from above)
+                    volatilities = {tf: vol for tf, vol in volatilities.items() if vol is not None}
                     if volatilities:
                         most_volatile = max(volatilities, key=volatilities.get)
                         least_volatile = min(volatilities, key=volatilities.get)
-                        print(f"   • Most volatile timeframe: {most_volatile} (σ=${volatilities[most_volatile]:.2f})")
-                        print(f"   • Least volatile timeframe: {least_volatile} (σ=${volatilities[least_volatile]:.2f})")
+                        lines.append(f"   • Most volatile timeframe: {most_volatile} (σ=${volatilities[most_volatile]:.2f})")
+                        lines.append(f"   • Least volatile timeframe: {least_volatile} (σ=${volatilities[least_volatile]:.2f})")
+                
+                sys.stdout.write("\n".join(lines) + "\n")
                 
             else:
                 print(f"❌ Failed to load data for {symbol}")
@@ -8,11 +8,57 @@ Kraken Portfolio class, allowing seamless switching between live and backtest mo
 import time
 import logging
 import json
+import json.encoder
 import os
-from typing import Dict, Optional, Any, List
+import atexit
+import weakref
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Any, List, Iterator, Tuple
 from decimal import Decimal
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+# Shared zero so balance arithmetic doesn't parse a new Decimal on every update
+_ZERO = Decimal("0")
+
+# Events that replace the whole portfolio and therefore keep a full balance snapshot
+_SNAPSHOT_EVENTS = frozenset({"initialization", "portfolio_reset"})
+
+# C-accelerated JSON string quoting (ensure_ascii=False semantics) for hand-built log lines
+_json_str = json.encoder.encode_basestring
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _append_lines(path: Path, lines: List[str], logger: logging.Logger) -> None:
+    """Append pending JSONL lines to a log file with a single write and clear them."""
+    if not lines:
+        return
+    
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, "".join(lines).encode("utf-8"))
+        finally:
+            os.close(fd)
+    except Exception as e:
+        logger.error(f"Failed to append portfolio states to JSONL log: {e}")
+    finally:
+        lines.clear()
+
 
 class PortfolioSim:
     """
@@ -22,7 +68,27 @@ class PortfolioSim:
     on simulated balances instead of making actual API calls to Kraken.
     """
     
-    def __init__(self, initial_balances: Optional[Dict[str, Decimal]] = None, timeout: int = 30):
+    __slots__ = (
+        "timeout", "logger", "_balances", "_balances_str",
+        "_ev_ts", "_ev_type", "_ev_asset", "_ev_old", "_ev_new", "_ev_extra", "_snapshots",
+        "_log_file_path", "_events_file_path", "_finalizer", "_write_buf", "_write_buf_limit",
+        "_track_history", "_initial_ts", "_initial_balances_str", "__weakref__"
+    )
+    
+    # Log locations, parsed once for all instances
+    _LOG_PATH = Path("modules/trader/backtest/logs/portfolio_sim.json")
+    _EVENTS_PATH = _LOG_PATH.with_suffix(".jsonl")
+    _LOG_DIR = _LOG_PATH.parent
+    
+    # Log directories already created in this process, shared by all instances
+    _log_dir_ready: set = set()
+    
+    # Open instances, closed at interpreter exit; weak so that dropped instances
+    # can still be garbage collected
+    _open_instances: "weakref.WeakSet[PortfolioSim]" = weakref.WeakSet()
+    
+    def __init__(self, initial_balances: Optional[Dict[str, Decimal]] = None, timeout: int = 30,
+                 track_history: bool = True):
         """
         Initialize the simulated portfolio.
         
@@ -30,8 +96,11 @@ class PortfolioSim:
             initial_balances: Starting balances as {asset: amount}. 
                             Defaults to 1 ETH and 1000 GBP
             timeout: Timeout parameter (kept for interface compatibility)
+            track_history: Record every event and write the replay logs. Disable for
+                           parameter sweeps that only need the final balances
         """
         self.timeout = timeout
+        self._track_history = track_history
         self.logger = logging.getLogger(__name__)
         
         # Set default balances: 1 ETH and 1000 GBP
@@ -44,19 +113,64 @@ class PortfolioSim:
             # Convert all values to Decimal and filter out zero balances
             self._balances = {}
             for asset, balance in initial_balances.items():
-                decimal_balance = Decimal(str(balance))
+                if isinstance(balance, Decimal):
+                    decimal_balance = balance
+                elif isinstance(balance, int):
+                    decimal_balance = Decimal(balance)
+                else:
+                    # Floats go through str() to keep their short repr, not the binary expansion
+                    decimal_balance = Decimal(str(balance))
                 if decimal_balance > 0:
                     self._balances[asset] = decimal_balance
         
-        # Historical state tracking for backtesting
-        self._historical_states: List[Dict[str, Any]] = []
-        self._log_file_path = "modules/trader/backtest/logs/portfolio_sim.json"
-        
-        # Ensure log directory exists
-        os.makedirs(os.path.dirname(self._log_file_path), exist_ok=True)
+        # String form of each balance, kept in sync with _balances so summaries and
+        # log records don't re-stringify every Decimal on each event
+        self._balances_str: Dict[str, str] = {asset: str(balance) for asset, balance in self._balances.items()}
+        
+        # Starting point for performance summaries; never changes after construction
+        self._initial_balances_str = dict(self._balances_str)
+        self._initial_ts = time.time()
+        
+        # Historical state tracking for backtesting, stored column-wise: one entry
+        # per column for every event instead of a copy of all balances per event
+        self._ev_ts = array("d")
+        self._ev_type: List[str] = []
+        self._ev_asset: List[Optional[str]] = []
+        self._ev_old: List[Optional[Decimal]] = []
+        self._ev_new: List[Optional[Decimal]] = []
+        self._ev_extra: List[Optional[Dict[str, Any]]] = []
+        self._snapshots: Dict[int, Dict[str, Decimal]] = {}
+        self._log_file_path = self._LOG_PATH
+        self._events_file_path = self._EVENTS_PATH
+        
+        # Pending JSONL lines, written out in a single batch once the limit is reached
+        self._write_buf: List[str] = []
+        self._write_buf_limit = 256
+        
+        if not track_history:
+            # No history means no log files
+            self._finalizer = None
+            self.logger.info(f"💼 Simulated portfolio initialized with {len(self._balances)} assets (history disabled)")
+            return
+        
+        # Ensure log directory exists (only checked once per directory per process)
+        log_dir = self._LOG_DIR
+        if log_dir not in PortfolioSim._log_dir_ready:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            PortfolioSim._log_dir_ready.add(log_dir)
+        
+        # Events are appended one JSON object per line in batches; the full summary
+        # file is only rewritten on explicit checkpoints and at teardown. Lines still
+        # pending when the instance is garbage collected are written out then
+        self._finalizer = weakref.finalize(
+            self, _append_lines, self._events_file_path, self._write_buf, self.logger
+        )
+        self._finalizer.atexit = False
+        PortfolioSim._open_instances.add(self)
         
         # Save initial state
         self._save_portfolio_state("initialization", {})
+        self._initial_ts = self._ev_ts[0]
         
         self.logger.info(f"💼 Simulated portfolio initialized with {len(self._balances)} assets")
         
@@ -69,9 +183,7 @@ class PortfolioSim:
             Only returns assets with non-zero balances.
         """
         # Return a copy to prevent external modification
-        balances_copy = self._balances.copy()
-        self.logger.debug(f"Retrieved simulated balances for {len(balances_copy)} assets")
-        return balances_copy
+        return self._balances.copy()
     
     def get_balance(self, asset: str) -> Optional[Decimal]:
         """
@@ -122,7 +234,7 @@ class PortfolioSim:
             - timestamp: When the data was retrieved
         """
         return {
-            "balances": {asset: str(balance) for asset, balance in self._balances.items()},
+            "balances": dict(self._balances_str),
             "asset_count": len(self._balances),
             "timestamp": time.time(),
             "total_assets": list(self._balances.keys())
@@ -139,10 +251,8 @@ class PortfolioSim:
         Returns:
             True if sufficient balance exists, False otherwise
         """
-        current_balance = self.get_balance(asset)
-        if current_balance is None:
-            return False
-        return current_balance >= required_amount
+        current_balance = self._balances.get(asset)
+        return current_balance is not None and current_balance >= required_amount
     
     def __str__(self) -> str:
         """String representation of the simulated portfolio."""
@@ -162,24 +272,21 @@ class PortfolioSim:
             asset: Asset symbol to update
             new_balance: New balance amount
         """
-        old_balance = self._balances.get(asset, Decimal("0"))
+        old_balance = self._balances.get(asset, _ZERO)
         
-        if new_balance <= 0:
+        if new_balance <= _ZERO:
             # Remove asset if balance becomes zero or negative
             self._balances.pop(asset, None)
+            self._balances_str.pop(asset, None)
             self.logger.debug(f"Removed {asset} from portfolio (balance: {new_balance})")
         else:
             self._balances[asset] = new_balance
+            self._balances_str[asset] = str(new_balance)
             self.logger.debug(f"Updated {asset} balance to {new_balance}")
         
         # Track the balance change
-        change_data = {
-            "asset": asset,
-            "old_balance": str(old_balance),
-            "new_balance": str(new_balance),
-            "change": str(new_balance - old_balance)
-        }
-        self._save_portfolio_state("balance_updated", change_data)
+        self._save_portfolio_state("balance_updated", asset=asset,
+                                   old_balance=old_balance, new_balance=new_balance)
     
     def add_to_balance(self, asset: str, amount: Decimal) -> None:
         """
@@ -189,9 +296,7 @@ class PortfolioSim:
             asset: Asset symbol to update
             amount: Amount to add (can be negative to subtract)
         """
-        current_balance = self.get_balance(asset) or Decimal("0")
-        new_balance = current_balance + amount
-        self.update_balance(asset, new_balance)
+        self.update_balance(asset, self._balances.get(asset, _ZERO) + amount)
     
     def execute_trade(self, sell_asset: str, sell_amount: Decimal, 
                      buy_asset: str, buy_amount: Decimal) -> bool:
@@ -207,8 +312,9 @@ class PortfolioSim:
         Returns:
             True if trade was executed successfully, False otherwise
         """
-        # Check if we have sufficient balance to sell
-        if not self.has_sufficient_balance(sell_asset, sell_amount):
+        # Check if we have sufficient balance to sell (inlined has_sufficient_balance)
+        current_balance = self._balances.get(sell_asset)
+        if current_balance is None or current_balance < sell_amount:
             self.logger.warning(f"Insufficient {sell_asset} balance for trade")
             return False
         
@@ -219,70 +325,257 @@ class PortfolioSim:
         self.logger.info(f"🔄 Executed trade: -{sell_amount} {sell_asset} → +{buy_amount} {buy_asset}")
         return True
     
+    def execute_trades_batch(self, sell_assets: List[str], sell_amounts: List[Decimal],
+                             buy_assets: List[str], buy_amounts: List[Decimal]) -> List[bool]:
+        """
+        Execute a sequence of simulated trades in a single call.
+        
+        Trades are applied in order with the same rules as execute_trade, but the
+        loop skips the per-trade method dispatch and INFO logging, which dominate
+        the cost of replaying long signal streams.
+        
+        Args:
+            sell_assets: Asset to sell for each trade
+            sell_amounts: Amount to sell for each trade
+            buy_assets: Asset to buy for each trade
+            buy_amounts: Amount to buy for each trade
+            
+        Returns:
+            One flag per trade, True if that trade was executed
+            
+        Raises:
+            ValueError: If the input sequences differ in length
+        """
+        if not len(sell_assets) == len(sell_amounts) == len(buy_assets) == len(buy_amounts):
+            raise ValueError("Trade batch sequences must all have the same length")
+        
+        balances = self._balances
+        update_balance = self.update_balance
+        results: List[bool] = []
+        
+        for sell_asset, sell_amount, buy_asset, buy_amount in zip(sell_assets, sell_amounts,
+                                                                  buy_assets, buy_amounts):
+            current_balance = balances.get(sell_asset)
+            if current_balance is None or current_balance < sell_amount:
+                results.append(False)
+                continue
+            
+            update_balance(sell_asset, current_balance - sell_amount)
+            update_balance(buy_asset, balances.get(buy_asset, _ZERO) + buy_amount)
+            results.append(True)
+        
+        self.logger.info(f"🔄 Executed {sum(results)}/{len(results)} trades in batch")
+        return results
+    
     def reset_to_defaults(self) -> None:
         """Reset portfolio to default balances (1 ETH, 1000 GBP)."""
-        self._balances = {
+        self._balances.clear()
+        self._balances.update({
             "ETH": Decimal("1.0"),
             "GBP": Decimal("1000.0")
-        }
+        })
+        self._balances_str = {asset: str(balance) for asset, balance in self._balances.items()}
         self._save_portfolio_state("portfolio_reset", {})
+        self._flush_events()
         self.logger.info("🔄 Portfolio reset to default balances")
     
     # Historical state tracking methods for backtesting
     
-    def _save_portfolio_state(self, event_type: str, event_data: Dict[str, Any]) -> None:
+    def _save_portfolio_state(self, event_type: str, event_data: Optional[Dict[str, Any]] = None,
+                              asset: Optional[str] = None, old_balance: Optional[Decimal] = None,
+                              new_balance: Optional[Decimal] = None) -> None:
         """
         Save the current portfolio state to historical tracking.
         
+        Balance changes are recorded as (asset, old, new) columns; a full copy of the
+        balances is only kept for events that replace the whole portfolio.
+        
         Args:
-            event_type: Type of event (e.g., 'balance_update', 'initialization')
+            event_type: Type of event (e.g., 'balance_updated', 'initialization')
             event_data: Additional data about the event
+            asset: Asset affected by a balance change
+            old_balance: Balance before the change
+            new_balance: Balance after the change
         """
-        timestamp = time.time()
-        datetime_str = datetime.fromtimestamp(timestamp).isoformat()
+        if not self._track_history:
+            return
         
-        state = {
-            "timestamp": timestamp,
-            "datetime": datetime_str,
-            "event_type": event_type,
-            "balances": {asset: str(balance) for asset, balance in self._balances.items()},
-            "asset_count": len(self._balances),
-            "event_data": event_data
+        timestamp = time.time()
+        index = len(self._ev_ts)
+        
+        self._ev_ts.append(timestamp)
+        self._ev_type.append(event_type)
+        self._ev_asset.append(asset)
+        self._ev_old.append(old_balance)
+        self._ev_new.append(new_balance)
+        self._ev_extra.append(event_data)
+        
+        if asset is not None:
+            # Balance changes are the bulk of the log and always have the same shape,
+            # so the line is assembled directly instead of going through json.dumps
+            line = (
+                f'{{"timestamp":{timestamp!r},"event_type":{_json_str(event_type)},'
+                f'"event_data":{{"asset":{_json_str(asset)},"old_balance":"{old_balance!s}",'
+                f'"new_balance":"{new_balance!s}","change":"{new_balance - old_balance!s}"}}}}\n'
+            )
+        else:
+            record = {
+                "timestamp": timestamp,
+                "event_type": event_type,
+                "event_data": event_data or {}
+            }
+            if event_type in _SNAPSHOT_EVENTS:
+                self._snapshots[index] = self._balances.copy()
+                record["balances"] = self._balances_str
+            line = _dumps(record).decode("utf-8") + "\n"
+        
+        # Queue the line for the events log
+        self._write_buf.append(line)
+        if len(self._write_buf) >= self._write_buf_limit:
+            self._flush_events()
+    
+    def _event_data(self, index: int) -> Dict[str, Any]:
+        """Build the event data for the event at the given position in the history."""
+        asset = self._ev_asset[index]
+        if asset is None:
+            return self._ev_extra[index] or {}
+        
+        old_balance = self._ev_old[index]
+        new_balance = self._ev_new[index]
+        return {
+            "asset": asset,
+            "old_balance": str(old_balance),
+            "new_balance": str(new_balance),
+            "change": str(new_balance - old_balance)
         }
+    
+    def _flush_events(self) -> None:
+        """Write all pending event lines to the JSONL log with a single write."""
+        if self._finalizer is not None:
+            _append_lines(self._events_file_path, self._write_buf, self.logger)
+    
+    def flush_summary(self) -> None:
+        """Flush pending events and write the full history and summary to the JSON log file."""
+        if not self._track_history:
+            return
         
-        # Add to historical states
-        self._historical_states.append(state)
+        self._flush_events()
         
-        # Save to JSON file
-        self._write_to_json_log()
-    
-    def _write_to_json_log(self) -> None:
-        """Write the historical data to JSON log file."""
         try:
             log_data = {
-                "portfolio_states": self._historical_states,
+                "portfolio_states": self.get_historical_states(),
                 "summary": {
-                    "total_states": len(self._historical_states),
-                    "start_time": self._historical_states[0]["timestamp"] if self._historical_states else None,
-                    "last_update": self._historical_states[-1]["timestamp"] if self._historical_states else None,
-                    "current_balances": {asset: str(balance) for asset, balance in self._balances.items()}
+                    "total_states": len(self._ev_ts),
+                    "start_time": self._ev_ts[0] if self._ev_ts else None,
+                    "last_update": self._ev_ts[-1] if self._ev_ts else None,
+                    "current_balances": self._balances_str
                 }
             }
             
-            with open(self._log_file_path, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            with open(self._log_file_path, 'wb') as f:
+                f.write(_dumps(log_data, indent=True))
                 
         except Exception as e:
             self.logger.error(f"Failed to write portfolio state to JSON log: {e}")
     
-    def get_historical_states(self) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Write the final summary and close the events log."""
+        if self._finalizer is None:
+            return
+        
+        self.flush_summary()
+        self._finalizer.detach()
+        self._finalizer = None
+        PortfolioSim._open_instances.discard(self)
+    
+    @classmethod
+    def _close_all(cls) -> None:
+        """Close every instance still open at interpreter exit."""
+        for portfolio in list(cls._open_instances):
+            portfolio.close()
+    
+    def __enter__(self) -> "PortfolioSim":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def iter_historical_states(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily rebuild historical portfolio states from the event columns.
+        
+        Yields:
+            Portfolio state dictionaries, oldest first
+        """
+        balances: Dict[str, Decimal] = {}
+        
+        for index, timestamp in enumerate(self._ev_ts):
+            snapshot = self._snapshots.get(index)
+            if snapshot is not None:
+                balances = snapshot.copy()
+            
+            asset = self._ev_asset[index]
+            if asset is not None:
+                new_balance = self._ev_new[index]
+                if new_balance > 0:
+                    balances[asset] = new_balance
+                else:
+                    balances.pop(asset, None)
+            
+            yield {
+                "timestamp": timestamp,
+                "datetime": datetime.fromtimestamp(timestamp).isoformat(),
+                "event_type": self._ev_type[index],
+                "balances": {a: str(b) for a, b in balances.items()},
+                "asset_count": len(balances),
+                "event_data": self._event_data(index)
+            }
+    
+    def get_historical_states(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get all historical portfolio states.
         
+        Prefer iter_historical_states() when the states are only read once.
+        
+        Returns:
+            Immutable sequence of historical portfolio states
+        """
+        return tuple(self.iter_historical_states())
+    
+    def as_columns(self) -> Dict[str, Any]:
+        """
+        Get the event history as NumPy arrays for vectorized analysis.
+        
+        Events that don't change a balance have an empty asset, a zero delta and a
+        NaN balance, so e.g. ``np.cumsum(cols["delta"][cols["asset"] == "ETH"])``
+        replays every ETH balance change in a single pass.
+        
         Returns:
-            List of historical portfolio states
+            Dictionary of equally sized, read-only arrays: ts, event_type, asset,
+            delta, balance
         """
-        return self._historical_states.copy()
+        import numpy as np
+        
+        count = len(self._ev_ts)
+        changes = list(zip(self._ev_asset, self._ev_old, self._ev_new))
+        
+        columns = {
+            "ts": np.array(self._ev_ts, dtype=np.float64),
+            "event_type": np.array(self._ev_type, dtype=str),
+            "asset": np.array([asset or "" for asset in self._ev_asset], dtype=str),
+            "delta": np.fromiter(
+                (float(new - old) if asset is not None else 0.0 for asset, old, new in changes),
+                dtype=np.float64, count=count
+            ),
+            "balance": np.fromiter(
+                (float(new) if asset is not None else np.nan for asset, old, new in changes),
+                dtype=np.float64, count=count
+            )
+        }
+        for column in columns.values():
+            column.setflags(write=False)
+        
+        return columns
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """
@@ -291,26 +584,29 @@ class PortfolioSim:
         Returns:
             Dictionary containing performance metrics
         """
-        if not self._historical_states:
+        if not self._ev_ts:
             return {}
         
-        initial_state = self._historical_states[0]
-        current_state = self._historical_states[-1]
+        start_time = self._initial_ts
+        end_time = self._ev_ts[-1]
         
         return {
-            "initial_balances": initial_state["balances"],
-            "current_balances": current_state["balances"],
-            "total_states": len(self._historical_states),
-            "duration_seconds": current_state["timestamp"] - initial_state["timestamp"],
-            "start_datetime": initial_state["datetime"],
-            "end_datetime": current_state["datetime"],
-            "log_file_path": self._log_file_path
+            "initial_balances": dict(self._initial_balances_str),
+            "current_balances": dict(self._balances_str),
+            "total_states": len(self._ev_ts),
+            "duration_seconds": end_time - start_time,
+            "start_datetime": datetime.fromtimestamp(start_time).isoformat(),
+            "end_datetime": datetime.fromtimestamp(end_time).isoformat(),
+            "log_file_path": str(self._log_file_path)
         }
     
     def save_manual_state(self, description: str, additional_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Manually save a portfolio state with custom description.
         
+        The checkpoint is appended to the events log right away; the full
+        summary file is only rewritten by flush_summary() and close().
+        
         Args:
             description: Description of the state
             additional_data: Optional additional data to save
@@ -320,3 +616,8 @@ class PortfolioSim:
             event_data.update(additional_data)
         
         self._save_portfolio_state("manual_checkpoint", event_data)
+        self._flush_events()
+
+
+# Write the summary of portfolios still open when the interpreter exits
+atexit.register(PortfolioSim._close_all)
@@ -6,14 +6,24 @@ It supports all Kraken trading operations with robust error handling, logging, a
 """
 
 import time
+import math
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from typing import Dict, List, Optional, Any, Union, Tuple
 from decimal import Decimal
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
 
 from shared.auth import KrakenAuth
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    from json import loads as _json_loads
+
 
 class OrderType(Enum):
     """Supported Kraken order types."""
@@ -77,6 +87,11 @@ class KrakenTrader:
     - Input validation
     - Rate limiting awareness
     - Fail-safe mechanisms
+    
+    Use it as a context manager so the HTTP session is closed on every exit path:
+    
+        with KrakenTrader(auth) as trader:
+            trader.get_open_orders()
     """
     
     BASE_URL = "https://api.kraken.com"
@@ -88,6 +103,16 @@ class KrakenTrader:
     CANCEL_ORDER_ENDPOINT = "/0/private/CancelOrder"
     CANCEL_ALL_ORDERS_ENDPOINT = "/0/private/CancelAll"
     CANCEL_ALL_ORDERS_AFTER_ENDPOINT = "/0/private/CancelAllOrdersAfter"
+    CANCEL_ORDER_BATCH_ENDPOINT = "/0/private/CancelOrderBatch"
+    
+    # Maximum number of orders Kraken accepts in one CancelOrderBatch call
+    CANCEL_BATCH_LIMIT = 50
+    
+    # Number of results Kraken returns per page of history endpoints
+    HISTORY_PAGE_SIZE = 50
+    
+    # Maximum number of distinct queries kept per response cache
+    CACHE_MAX_ENTRIES = 32
     
     # Query endpoints
     OPEN_ORDERS_ENDPOINT = "/0/private/OpenOrders"
@@ -99,6 +124,7 @@ class KrakenTrader:
     LEDGERS_ENDPOINT = "/0/private/Ledgers"
     QUERY_LEDGERS_ENDPOINT = "/0/private/QueryLedgers"
     TRADE_VOLUME_ENDPOINT = "/0/private/TradeVolume"
+    WEBSOCKETS_TOKEN_ENDPOINT = "/0/private/GetWebSocketsToken"
     
     # Export endpoints
     ADD_EXPORT_ENDPOINT = "/0/private/AddExport"
@@ -106,7 +132,37 @@ class KrakenTrader:
     RETRIEVE_EXPORT_ENDPOINT = "/0/private/RetrieveExport"
     REMOVE_EXPORT_ENDPOINT = "/0/private/RemoveExport"
     
-    def __init__(self, auth: KrakenAuth, timeout: int = 30, max_retries: int = 3):
+    # Cost of each call against Kraken's REST API counter. History calls cost 2;
+    # order placement and cancellation are limited by the trading engine instead
+    # and do not count. Any endpoint not listed costs 1
+    ENDPOINT_COST = {
+        TRADES_HISTORY_ENDPOINT: 2,
+        QUERY_TRADES_ENDPOINT: 2,
+        LEDGERS_ENDPOINT: 2,
+        QUERY_LEDGERS_ENDPOINT: 2,
+        ADD_ORDER_ENDPOINT: 0,
+        AMEND_ORDER_ENDPOINT: 0,
+        CANCEL_ORDER_ENDPOINT: 0,
+        CANCEL_ORDER_BATCH_ENDPOINT: 0,
+    }
+    
+    # Endpoints that must not be sent twice: a replay under a fresh nonce would be
+    # accepted as a second order
+    NON_IDEMPOTENT_ENDPOINTS = frozenset({ADD_ORDER_ENDPOINT, AMEND_ORDER_ENDPOINT})
+    
+    # Accepted add_order values, built once instead of on every call
+    _VALID_SIDES = frozenset(s.value for s in OrderSide)
+    _VALID_ORDER_TYPES = frozenset(ot.value for ot in OrderType)
+    
+    def __init__(
+        self,
+        auth: KrakenAuth,
+        timeout: int = 30,
+        max_retries: int = 3,
+        rate_limit_capacity: float = 15,
+        rate_limit_decay: float = 0.33,
+        cache_ttl: float = 30.0
+    ):
         """
         Initialize the Kraken trader.
         
@@ -114,28 +170,64 @@ class KrakenTrader:
             auth: KrakenAuth instance for API authentication
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum retry attempts for failed requests (default: 3)
+            rate_limit_capacity: Maximum API counter for the account tier
+                (default: 15, Starter; Intermediate and Pro use 20)
+            rate_limit_decay: Counter decrease per second for the account tier
+                (default: 0.33, Starter; Intermediate 0.5, Pro 1)
+            cache_ttl: Seconds trade volume and open positions (without
+                calculations) are reused before the API is queried again;
+                0 disables caching (default: 30.0)
         """
         self.auth = auth
         self.timeout = timeout
         self.max_retries = max_retries
         self.logger = logging.getLogger(__name__)
+        
+        # Token bucket mirroring Kraken's API counter, shared by all threads
+        self._bucket_capacity = float(rate_limit_capacity)
+        self._bucket_refill_per_s = float(rate_limit_decay)
+        self._bucket_tokens = self._bucket_capacity
+        self._bucket_ts = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        
+        # (monotonic fetch time, result) per query for slow-changing account data
+        self.cache_ttl = cache_ttl
+        self._volume_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._positions_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        
         self._session = requests.Session()
         
+        # Every call goes to the one Kraken host: a single pool with headroom for
+        # parallel calls keeps TLS connections alive instead of re-handshaking.
+        # Retries stay in _make_request, so the adapter never replays a request
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, pool_block=False, max_retries=0)
+        self._session.mount("https://", adapter)
+        
         # Set up session headers
         self._session.headers.update({
             "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "Kraken-Auto-Trader/1.0"
+            "User-Agent": "Kraken-Auto-Trader/1.0",
+            "Connection": "keep-alive"
         })
         
+        # Full URL per endpoint constant and the bound POST method, resolved once
+        self._urls = {
+            endpoint: f"{self.BASE_URL}{endpoint}"
+            for name, endpoint in vars(KrakenTrader).items()
+            if name.endswith("_ENDPOINT")
+        }
+        self._post = self._session.post
+        
         self.logger.info("🔧 Kraken trader initialized")
     
-    def _make_request(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_request(self, endpoint: str, data: Dict[str, Any], json_body: bool = False) -> Dict[str, Any]:
         """
         Make an authenticated request to the Kraken API with retries and error handling.
         
         Args:
             endpoint: API endpoint path
             data: Request parameters
+            json_body: Send the parameters as a JSON body (for list parameters)
             
         Returns:
             API response data
@@ -143,23 +235,28 @@ class KrakenTrader:
         Raises:
             Exception: For API errors or network issues
         """
-        nonce = str(int(time.time() * 1000))
-        data["nonce"] = nonce
-        
-        # Get authentication headers
-        auth_headers = self.auth.sign_request(endpoint, data)
-        headers = {**self._session.headers, **auth_headers}
-        
-        url = f"{self.BASE_URL}{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.BASE_URL}{endpoint}"
+        cost = self.ENDPOINT_COST.get(endpoint, 1)
         
         for attempt in range(self.max_retries + 1):
+            # Pace the call before signing, so nonces still reach Kraken in order
+            self._throttle(cost)
+            
+            # Get authentication headers and the encoded body they sign; requests
+            # layers the headers over the session headers and sends the body as-is.
+            # KrakenAuth adds a fresh nonce on every attempt, as Kraken rejects a
+            # nonce it has already seen
+            auth_headers, body = self.auth.sign_body(endpoint, data, json_body)
+            if json_body:
+                auth_headers["Content-Type"] = "application/json"
+            
             try:
-                self.logger.debug(f"📡 Making request to {endpoint} (attempt {attempt + 1})")
+                self.logger.debug("📡 Making request to %s (attempt %s)", endpoint, attempt + 1)
                 
-                response = self._session.post(
+                response = self._post(
                     url,
-                    headers=headers,
-                    data=data,
+                    headers=auth_headers,
+                    data=body,
                     timeout=self.timeout
                 )
                 
@@ -168,7 +265,7 @@ class KrakenTrader:
                 
                 # Parse JSON response
                 try:
-                    result = response.json()
+                    result = _json_loads(response.content)
                 except ValueError as e:
                     raise Exception(f"Invalid JSON response from Kraken API: {e}")
                 
@@ -183,18 +280,88 @@ class KrakenTrader:
                 return result["result"]
                 
             except requests.RequestException as e:
+                if endpoint in self.NON_IDEMPOTENT_ENDPOINTS and not self._request_not_sent(e):
+                    # Read timeouts and 5xx responses come after Kraken may have
+                    # received the order; check open/closed orders before resending
+                    self.logger.error("❌ Request to %s may have reached Kraken, not retrying: %s", endpoint, e)
+                    raise Exception(f"Network error, order state unknown: {e}")
+                
                 if attempt == self.max_retries:
-                    self.logger.error(f"❌ Request failed after {self.max_retries + 1} attempts: {e}")
+                    self.logger.error("❌ Request failed after %s attempts: %s", self.max_retries + 1, e)
                     raise Exception(f"Network error after {self.max_retries + 1} attempts: {e}")
                 
                 wait_time = 2 ** attempt  # Exponential backoff
-                self.logger.warning(f"⚠️  Request failed (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
+                self.logger.warning("⚠️  Request failed (attempt %s), retrying in %ss: %s", attempt + 1, wait_time, e)
                 time.sleep(wait_time)
             
             except Exception as e:
-                self.logger.error(f"❌ API request failed: {e}")
+                self.logger.error("❌ API request failed: %s", e)
                 raise
     
+    @staticmethod
+    def _request_not_sent(error: requests.RequestException) -> bool:
+        """
+        Check whether a failed request never reached the server.
+        
+        Only a failure to open the connection (refused, unresolvable host,
+        connect timeout) guarantees that; an aborted connection or a read
+        timeout may follow a request the server already received.
+        """
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.ConnectionError) or not error.args:
+            return False
+        return isinstance(getattr(error.args[0], "reason", None), ConnectTimeoutError)
+    
+    def _throttle(self, cost: float) -> None:
+        """
+        Wait until the rate limit bucket holds enough tokens for a call.
+        
+        Tokens are reserved under the lock and the wait happens outside it, so
+        concurrent callers queue up in order without holding each other up
+        longer than their own share of the budget.
+        
+        Args:
+            cost: Number of tokens the call consumes
+        """
+        if cost <= 0:
+            return
+        
+        with self._bucket_lock:
+            now = time.monotonic()
+            tokens = min(
+                self._bucket_capacity,
+                self._bucket_tokens + (now - self._bucket_ts) * self._bucket_refill_per_s
+            )
+            tokens -= cost
+            self._bucket_tokens = tokens
+            self._bucket_ts = now
+        
+        if tokens < 0:
+            wait_time = -tokens / self._bucket_refill_per_s
+            self.logger.debug("⏳ Rate limit reached, waiting %.2fs", wait_time)
+            time.sleep(wait_time)
+    
+    def _cache_get(self, cache: Dict, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached result younger than cache_ttl, if any."""
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return dict(cached[1])
+        return None
+    
+    def _cache_put(self, cache: Dict, key: Tuple, result: Dict[str, Any]) -> None:
+        """Store a result, dropping the cache first once it is full."""
+        if self.cache_ttl <= 0:
+            return
+        if len(cache) >= self.CACHE_MAX_ENTRIES and key not in cache:
+            cache.clear()
+        cache[key] = (time.monotonic(), result)
+    
+    def invalidate_cache(self) -> None:
+        """Discard cached trade volume and positions, e.g. after an order fills."""
+        self._volume_cache.clear()
+        self._positions_cache.clear()
+    
     def add_order(
         self,
         pair: str,
@@ -254,25 +421,24 @@ class KrakenTrader:
         if not pair:
             raise ValueError("Asset pair is required")
         
-        # Convert enums to strings
-        side_str = side.value if isinstance(side, OrderSide) else str(side)
-        order_type_str = order_type.value if isinstance(order_type, OrderType) else str(order_type)
+        # Convert enums to strings (enum members carry .value, strings do not)
+        side_str = getattr(side, "value", side)
+        order_type_str = getattr(order_type, "value", order_type)
         
-        if side_str not in ["buy", "sell"]:
+        if side_str not in self._VALID_SIDES:
             raise ValueError(f"Invalid order side: {side_str}")
         
         # Validate order type
-        valid_order_types = [ot.value for ot in OrderType]
-        if order_type_str not in valid_order_types:
+        if order_type_str not in self._VALID_ORDER_TYPES:
             raise ValueError(f"Invalid order type: {order_type_str}")
         
-        # Validate volume
+        # Validate volume; only the sign matters here, the original string is sent
         try:
-            volume_decimal = Decimal(str(volume))
-            if volume_decimal <= 0:
-                raise ValueError("Volume must be positive")
+            volume_float = float(volume)
         except (ValueError, TypeError):
             raise ValueError(f"Invalid volume: {volume}")
+        if not (volume_float > 0 and math.isfinite(volume_float)):
+            raise ValueError(f"Invalid volume: {volume}")
         
         # Build request data
         data = {
@@ -290,8 +456,7 @@ class KrakenTrader:
             data["price2"] = str(price2)
         
         if trigger:
-            trigger_str = trigger.value if isinstance(trigger, TriggerType) else str(trigger)
-            data["trigger"] = trigger_str
+            data["trigger"] = getattr(trigger, "value", trigger)
         
         if leverage:
             data["leverage"] = str(leverage)
@@ -318,19 +483,14 @@ class KrakenTrader:
             data["validate"] = "true"
         
         if order_flags:
-            flags = []
-            for flag in order_flags:
-                flag_str = flag.value if isinstance(flag, OrderFlags) else str(flag)
-                flags.append(flag_str)
-            data["oflags"] = ",".join(flags)
+            data["oflags"] = ",".join(getattr(flag, "value", flag) for flag in order_flags)
         
         if time_in_force:
             data["timeinforce"] = time_in_force
         
         # Conditional close parameters
         if close_order_type:
-            close_type_str = close_order_type.value if isinstance(close_order_type, OrderType) else str(close_order_type)
-            data["close[ordertype]"] = close_type_str
+            data["close[ordertype]"] = getattr(close_order_type, "value", close_order_type)
         
         if close_price:
             data["close[price]"] = str(close_price)
@@ -338,7 +498,7 @@ class KrakenTrader:
         if close_price2:
             data["close[price2]"] = str(close_price2)
         
-        self.logger.info(f"📝 Placing {side_str} order: {volume} {pair} @ {price if price else 'market'}")
+        self.logger.info("📝 Placing %s order: %s %s @ %s", side_str, volume, pair, price or 'market')
         
         try:
             result = self._make_request(self.ADD_ORDER_ENDPOINT, data)
@@ -346,13 +506,15 @@ class KrakenTrader:
             if validate:
                 self.logger.info("✅ Order validation successful")
             else:
-                order_ids = result.get("txid", [])
-                self.logger.info(f"✅ Order placed successfully. Order IDs: {', '.join(order_ids)}")
+                # A placed order may open or change a position right away
+                self._positions_cache.clear()
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("✅ Order placed successfully. Order IDs: %s", ", ".join(result.get("txid", [])))
             
             return result
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to place order: {e}")
+            self.logger.error("❌ Failed to place order: %s", e)
             raise
     
     def cancel_order(
@@ -388,14 +550,14 @@ class KrakenTrader:
         elif client_order_id:
             data["cl_ord_id"] = client_order_id
         
-        self.logger.info(f"🗑️  Cancelling order: {order_id or user_ref or client_order_id}")
+        self.logger.info("🗑️  Cancelling order: %s", order_id or user_ref or client_order_id)
         
         try:
             result = self._make_request(self.CANCEL_ORDER_ENDPOINT, data)
             self.logger.info("✅ Order cancelled successfully")
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to cancel order: {e}")
+            self.logger.error("❌ Failed to cancel order: %s", e)
             raise
     
     def cancel_all_orders(self) -> Dict[str, Any]:
@@ -410,12 +572,70 @@ class KrakenTrader:
         try:
             result = self._make_request(self.CANCEL_ALL_ORDERS_ENDPOINT, {})
             count = result.get("count", 0)
-            self.logger.info(f"✅ Cancelled {count} orders")
+            self.logger.info("✅ Cancelled %s orders", count)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to cancel all orders: {e}")
+            self.logger.error("❌ Failed to cancel all orders: %s", e)
             raise
     
+    def cancel_orders_batch(self, order_ids: List[str]) -> Dict[str, Any]:
+        """
+        Cancel several orders with one CancelOrderBatch request per 50 orders.
+        
+        Args:
+            order_ids: Order transaction IDs, user references or client order IDs
+            
+        Returns:
+            Cancellation result with the total count of cancelled orders
+            
+        Raises:
+            ValueError: If no order IDs are provided
+            Exception: For API errors
+        """
+        if not order_ids:
+            raise ValueError("Must provide at least one order ID")
+        
+        self.logger.info("🗑️  Cancelling %s orders in batch", len(order_ids))
+        
+        limit = self.CANCEL_BATCH_LIMIT
+        count = 0
+        
+        try:
+            for start in range(0, len(order_ids), limit):
+                data = {"orders": list(order_ids[start:start + limit])}
+                result = self._make_request(self.CANCEL_ORDER_BATCH_ENDPOINT, data, json_body=True)
+                count += result.get("count", 0)
+            self.logger.info("✅ Cancelled %s orders", count)
+            return {"count": count}
+        except Exception as e:
+            self.logger.error("❌ Failed to cancel order batch: %s", e)
+            raise
+    
+    def cancel_by_pair(self, pair: str) -> Dict[str, Any]:
+        """
+        Cancel all open orders for one trading pair.
+        
+        Uses one OpenOrders query and batched cancels instead of one
+        CancelOrder call per order.
+        
+        Args:
+            pair: Trading pair as shown in order descriptions (e.g., "XBTUSD")
+            
+        Returns:
+            Cancellation result with count of cancelled orders
+        """
+        open_orders = self.get_open_orders().get("open", {})
+        order_ids = [
+            txid for txid, order in open_orders.items()
+            if order.get("descr", {}).get("pair") == pair
+        ]
+        
+        if not order_ids:
+            self.logger.info("📋 No open orders for %s", pair)
+            return {"count": 0}
+        
+        return self.cancel_orders_batch(order_ids)
+    
     def cancel_all_orders_after(self, timeout: int) -> Dict[str, Any]:
         """
         Cancel all orders after a specified timeout (dead man's switch).
@@ -429,7 +649,7 @@ class KrakenTrader:
         data = {"timeout": str(timeout)}
         
         if timeout > 0:
-            self.logger.info(f"⏰ Setting dead man's switch: cancel all orders after {timeout}s")
+            self.logger.info("⏰ Setting dead man's switch: cancel all orders after %ss", timeout)
         else:
             self.logger.info("⏰ Disabling dead man's switch")
         
@@ -438,7 +658,7 @@ class KrakenTrader:
             self.logger.info("✅ Dead man's switch configured")
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to configure dead man's switch: {e}")
+            self.logger.error("❌ Failed to configure dead man's switch: %s", e)
             raise
     
     def get_open_orders(
@@ -472,10 +692,10 @@ class KrakenTrader:
         try:
             result = self._make_request(self.OPEN_ORDERS_ENDPOINT, data)
             order_count = len(result.get("open", {}))
-            self.logger.info(f"📋 Retrieved {order_count} open orders")
+            self.logger.info("📋 Retrieved %s open orders", order_count)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to get open orders: {e}")
+            self.logger.error("❌ Failed to get open orders: %s", e)
             raise
     
     def get_closed_orders(
@@ -536,10 +756,10 @@ class KrakenTrader:
         try:
             result = self._make_request(self.CLOSED_ORDERS_ENDPOINT, data)
             order_count = len(result.get("closed", {}))
-            self.logger.info(f"📋 Retrieved {order_count} closed orders")
+            self.logger.info("📋 Retrieved %s closed orders", order_count)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to get closed orders: {e}")
+            self.logger.error("❌ Failed to get closed orders: %s", e)
             raise
     
     def query_orders_info(self, order_ids: List[str], trades: bool = False, user_ref: Optional[int] = None) -> Dict[str, Any]:
@@ -564,10 +784,10 @@ class KrakenTrader:
         
         try:
             result = self._make_request(self.QUERY_ORDERS_ENDPOINT, data)
-            self.logger.info(f"📋 Retrieved info for {len(order_ids)} orders")
+            self.logger.info("📋 Retrieved info for %s orders", len(order_ids))
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to query orders: {e}")
+            self.logger.error("❌ Failed to query orders: %s", e)
             raise
     
     def get_trades_history(
@@ -618,10 +838,10 @@ class KrakenTrader:
         try:
             result = self._make_request(self.TRADES_HISTORY_ENDPOINT, data)
             trade_count = len(result.get("trades", {}))
-            self.logger.info(f"📊 Retrieved {trade_count} trades from history")
+            self.logger.info("📊 Retrieved %s trades from history", trade_count)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to get trades history: {e}")
+            self.logger.error("❌ Failed to get trades history: %s", e)
             raise
     
     def get_open_positions(
@@ -633,6 +853,9 @@ class KrakenTrader:
         """
         Get information about open positions.
         
+        Without do_calcs, results younger than cache_ttl seconds are returned
+        without another API call.
+        
         Args:
             transaction_ids: List of transaction IDs to query
             do_calcs: Whether to include profit/loss calculations
@@ -641,6 +864,14 @@ class KrakenTrader:
         Returns:
             Open positions information
         """
+        # Profit/loss calculations move with every tick, so only plain positions are cached
+        cache_key = None
+        if not do_calcs:
+            cache_key = (consolidation, *(transaction_ids or ()))
+            cached = self._cache_get(self._positions_cache, cache_key)
+            if cached is not None:
+                return cached
+        
         data = {"consolidation": consolidation}
         
         if transaction_ids:
@@ -652,22 +883,33 @@ class KrakenTrader:
         try:
             result = self._make_request(self.OPEN_POSITIONS_ENDPOINT, data)
             position_count = len(result)
-            self.logger.info(f"📊 Retrieved {position_count} open positions")
+            self.logger.info("📊 Retrieved %s open positions", position_count)
+            if cache_key is not None:
+                self._cache_put(self._positions_cache, cache_key, result)
+                return dict(result)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to get open positions: {e}")
+            self.logger.error("❌ Failed to get open positions: %s", e)
             raise
     
     def get_trade_volume(self, pairs: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get trade volume and fees information.
         
+        Results younger than cache_ttl seconds are returned without another
+        API call.
+        
         Args:
             pairs: List of asset pairs to query
             
         Returns:
             Trade volume and fee information
         """
+        cache_key = tuple(sorted(pairs or ()))
+        cached = self._cache_get(self._volume_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         data = {}
         
         if pairs:
@@ -676,9 +918,28 @@ class KrakenTrader:
         try:
             result = self._make_request(self.TRADE_VOLUME_ENDPOINT, data)
             self.logger.info("📊 Retrieved trade volume information")
-            return result
+            self._cache_put(self._volume_cache, cache_key, result)
+            return dict(result)
         except Exception as e:
-            self.logger.error(f"❌ Failed to get trade volume: {e}")
+            self.logger.error("❌ Failed to get trade volume: %s", e)
+            raise
+    
+    def get_websockets_token(self) -> str:
+        """
+        Get a token for authenticating the private WebSocket API.
+        
+        The token must be used to connect within 15 minutes and stays valid
+        for as long as the connection is open.
+        
+        Returns:
+            WebSocket authentication token
+        """
+        try:
+            result = self._make_request(self.WEBSOCKETS_TOKEN_ENDPOINT, {})
+            self.logger.info("🔑 Retrieved WebSocket token")
+            return result["token"]
+        except Exception as e:
+            self.logger.error("❌ Failed to get WebSocket token: %s", e)
             raise
     
     def get_ledgers(
@@ -729,10 +990,10 @@ class KrakenTrader:
         try:
             result = self._make_request(self.LEDGERS_ENDPOINT, data)
             ledger_count = len(result.get("ledger", {}))
-            self.logger.info(f"📊 Retrieved {ledger_count} ledger entries")
+            self.logger.info("📊 Retrieved %s ledger entries", ledger_count)
             return result
         except Exception as e:
-            self.logger.error(f"❌ Failed to get ledgers: {e}")
+            self.logger.error("❌ Failed to get ledgers: %s", e)
             raise
     
     # Market order helpers
@@ -771,10 +1032,114 @@ class KrakenTrader:
         """Place a take profit sell order."""
         return self.add_order(pair, OrderSide.SELL, OrderType.TAKE_PROFIT, volume, price=profit_price, **kwargs)
     
+    # Async variants. Each runs the blocking call in a worker thread over the shared
+    # keep-alive session, so independent requests can be awaited together, e.g.
+    # ``await asyncio.gather(*(trader.cancel_order_async(txid) for txid in ids))``.
+    # Overlapping private calls may reach Kraken out of nonce order; enable a nonce
+    # window on the API key when fanning out.
+    
+    async def add_order_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of add_order()."""
+        return await asyncio.to_thread(self.add_order, *args, **kwargs)
+    
+    async def cancel_order_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of cancel_order()."""
+        return await asyncio.to_thread(self.cancel_order, *args, **kwargs)
+    
+    async def cancel_all_orders_async(self) -> Dict[str, Any]:
+        """Async variant of cancel_all_orders()."""
+        return await asyncio.to_thread(self.cancel_all_orders)
+    
+    async def get_open_orders_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of get_open_orders()."""
+        return await asyncio.to_thread(self.get_open_orders, *args, **kwargs)
+    
+    async def get_closed_orders_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of get_closed_orders()."""
+        return await asyncio.to_thread(self.get_closed_orders, *args, **kwargs)
+    
+    async def query_orders_info_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of query_orders_info()."""
+        return await asyncio.to_thread(self.query_orders_info, *args, **kwargs)
+    
+    async def get_trades_history_all(
+        self,
+        trade_type: str = "all",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_concurrency: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Fetch every page of trade history, optionally requesting pages concurrently.
+        
+        The first page reports the total count; the remaining offsets are then
+        requested at most max_concurrency at a time, paced by the rate limit
+        bucket. Pass an explicit end so trades arriving meanwhile do not shift
+        the pages.
+        
+        Concurrent requests can reach Kraken out of nonce order, which a key
+        without a nonce window rejects with EAPI:Invalid nonce. Only raise
+        max_concurrency above 1 for API keys with a nonce window configured.
+        
+        Args:
+            trade_type: Type of trade ('all', 'any position', 'closed position', 'closing position', 'no position')
+            start: Starting unix timestamp or trade ID
+            end: Ending unix timestamp or trade ID
+            max_concurrency: Maximum number of pages in flight at once (default: 1,
+                             sequential; needs a nonce window on the key if higher)
+            
+        Returns:
+            Trade history with all trades merged and the total count
+        """
+        first = await asyncio.to_thread(
+            self.get_trades_history, trade_type=trade_type, start=start, end=end
+        )
+        count = int(first.get("count", 0))
+        trades = dict(first.get("trades", {}))
+        
+        page_size = self.HISTORY_PAGE_SIZE
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_page(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.get_trades_history, trade_type=trade_type, start=start, end=end,
+                    offset=offset, without_count=True
+                )
+        
+        pages = await asyncio.gather(
+            *(fetch_page(offset) for offset in range(page_size, count, page_size))
+        )
+        for page in pages:
+            trades.update(page.get("trades", {}))
+        
+        self.logger.info("📊 Retrieved %s of %s trades from history", len(trades), count)
+        return {"trades": trades, "count": count}
+    
+    async def aclose(self) -> None:
+        """Async variant of close()."""
+        await asyncio.to_thread(self.close)
+    
     def __str__(self) -> str:
         """String representation of the trader."""
         return f"KrakenTrader(timeout={self.timeout}, max_retries={self.max_retries})"
     
+    def __enter__(self) -> "KrakenTrader":
+        """Use the trader as a context manager: ``with KrakenTrader(auth) as trader: ...``."""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Close the HTTP session, also when the block raised."""
+        self.close()
+    
+    async def __aenter__(self) -> "KrakenTrader":
+        """Use the trader as an async context manager."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the HTTP session, also when the block raised."""
+        await self.aclose()
+    
     def close(self) -> None:
         """Close the HTTP session."""
         if self._session:
@@ -0,0 +1,328 @@
+"""
+Kraken WebSocket Order Entry
+
+This module provides order placement and cancellation over Kraken's authenticated
+WebSocket API. One connection carries every order, so calls skip the per-request
+HTTP round-trip and signature of the REST API; responses are matched to requests
+by their req_id.
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import Dict, List, Optional, Any, Union, Tuple
+from decimal import Decimal
+import websockets
+
+from .trade import KrakenTrader, OrderSide, OrderType, OrderFlags
+
+try:
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj: Any) -> str:
+        # Decimal amounts are sent as their exact string form, never via float
+        return _orjson_dumps(obj, default=str).decode('utf-8')
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    from json import dumps as _stdlib_json_dumps, loads as _json_loads
+
+    def _json_dumps(obj: Any) -> str:
+        return _stdlib_json_dumps(obj, default=str)
+
+
+# WebSocket add_order parameters and the REST add_order keyword taking the same value
+_REST_KEYWORDS = {
+    "cl_ord_id": "client_order_id",
+    "order_userref": "user_ref",
+    "reduce_only": "reduce_only",
+    "deadline": "deadline",
+    "validate": "validate",
+}
+
+# WebSocket add_order switches and the REST order flag each one sets
+_REST_FLAGS = {
+    "post_only": OrderFlags.POST,
+    "no_mpp": OrderFlags.NOMPP,
+}
+
+# WebSocket fee_preference values and the matching REST order flag
+_REST_FEE_FLAGS = {
+    "base": OrderFlags.FCIB,
+    "quote": OrderFlags.FCIQ,
+}
+
+
+def _rest_order_kwargs(price: Optional[Union[Decimal, str, float]], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate WebSocket add_order parameters into KrakenTrader.add_order keywords.
+    
+    Args:
+        price: Limit price of the WebSocket order
+        params: Further WebSocket add_order parameters
+    
+    Returns:
+        Keyword arguments placing the same order over REST
+    
+    Raises:
+        ValueError: If a parameter has no REST equivalent
+    """
+    kwargs: Dict[str, Any] = {"price": price}
+    flags: List[OrderFlags] = []
+    
+    for name, value in params.items():
+        if name in _REST_KEYWORDS:
+            kwargs[_REST_KEYWORDS[name]] = value
+        elif name in _REST_FLAGS:
+            if value:
+                flags.append(_REST_FLAGS[name])
+        elif name == "fee_preference" and value in _REST_FEE_FLAGS:
+            flags.append(_REST_FEE_FLAGS[value])
+        elif name == "time_in_force":
+            kwargs["time_in_force"] = str(value).upper()
+        elif (name == "triggers" and isinstance(value, dict)
+              and value.keys() <= {"reference", "price", "price_type"}
+              and value.get("price_type", "static") == "static"):
+            # REST takes the trigger price as price and the limit price as price2
+            kwargs["price"] = value.get("price")
+            kwargs["price2"] = price
+            if "reference" in value:
+                kwargs["trigger"] = value["reference"]
+        else:
+            raise ValueError(f"WebSocket order parameter {name}={value!r} has no REST equivalent")
+    
+    if flags:
+        kwargs["order_flags"] = flags
+    
+    return kwargs
+
+
+class KrakenWSTrader:
+    """
+    WebSocket order entry companion to KrakenTrader.
+    
+    Connects lazily on the first order, authenticating with a token from the
+    REST GetWebSocketsToken endpoint, and multiplexes add_order / cancel_order
+    requests over the one connection.
+    
+    If the connection cannot be opened or the request cannot be sent, the call
+    falls back to the REST trader. Once a request has been sent it is never
+    retried over REST, since the exchange may already have acted on it.
+    """
+    
+    WEBSOCKET_URL = "wss://ws-auth.kraken.com/v2"
+    
+    def __init__(self, trader: KrakenTrader, timeout: float = 10.0):
+        """
+        Initialize the WebSocket trader.
+        
+        Args:
+            trader: KrakenTrader used for the token and as REST fallback
+            timeout: Seconds to wait for a response to each request (default: 10)
+        """
+        self.trader = trader
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        
+        # Connection state
+        self._ws = None
+        self._token: Optional[str] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        
+        # Outstanding requests by req_id
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._req_ids = itertools.count(1)
+        
+        self.logger.info("🔧 Kraken WebSocket trader initialized")
+    
+    async def connect(self) -> None:
+        """Open and authenticate the WebSocket connection if it is not open yet."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        
+        async with self._connect_lock:
+            if self._ws is not None:
+                return
+            
+            try:
+                self._token = await asyncio.to_thread(self.trader.get_websockets_token)
+            except Exception as e:
+                # Reported like any other failure to connect, so callers fall back to REST
+                raise ConnectionError(f"Could not get a WebSocket token: {e}") from e
+            
+            self.logger.info("🔗 Connecting to %s...", self.WEBSOCKET_URL)
+            self._ws = await websockets.connect(
+                self.WEBSOCKET_URL,
+                ping_interval=20,
+                ping_timeout=10,
+                close_timeout=10
+            )
+            self._reader = asyncio.create_task(self._read_loop(self._ws))
+            self.logger.info("✅ WebSocket trader connected")
+    
+    async def _read_loop(self, ws) -> None:
+        """Resolve pending requests from incoming messages until the connection closes."""
+        try:
+            async for message in ws:
+                try:
+                    data = _json_loads(message)
+                except ValueError as e:
+                    self.logger.warning("⚠️  Invalid JSON received: %s", e)
+                    continue
+                
+                if not isinstance(data, dict):
+                    continue
+                
+                future = self._pending.pop(data.get("req_id"), None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+        except websockets.ConnectionClosed as e:
+            self.logger.warning("⚠️  WebSocket trader disconnected: %s", e)
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            
+            # Requests already sent have an unknown outcome; surface that to the callers
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket closed before a response was received"))
+    
+    async def _send(self, method: str, params: Dict[str, Any]) -> Tuple[int, asyncio.Future]:
+        """
+        Send a request and return its req_id and the future that receives its response.
+        
+        Raises:
+            OSError, websockets.WebSocketException: If the request could not be sent
+        """
+        await self.connect()
+        
+        req_id = next(self._req_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        
+        params["token"] = self._token
+        try:
+            await self._ws.send(_json_dumps({"method": method, "params": params, "req_id": req_id}))
+        except BaseException:
+            self._pending.pop(req_id, None)
+            raise
+        
+        return req_id, future
+    
+    async def _result(self, req_id: int, future: asyncio.Future) -> Dict[str, Any]:
+        """Wait for a response and return its result, raising on API errors."""
+        try:
+            response = await asyncio.wait_for(future, self.timeout)
+        finally:
+            # Already gone once answered; dropped here on timeout or cancellation
+            self._pending.pop(req_id, None)
+        
+        if not response.get("success"):
+            raise Exception(f"Kraken WebSocket error: {response.get('error')}")
+        
+        return response.get("result", {})
+    
+    async def add_order(
+        self,
+        symbol: str,
+        side: Union[OrderSide, str],
+        order_type: Union[OrderType, str],
+        volume: Union[Decimal, str, float],
+        price: Optional[Union[Decimal, str, float]] = None,
+        rest_pair: Optional[str] = None,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Place an order over the WebSocket connection.
+        
+        Args:
+            symbol: WebSocket symbol (e.g., 'BTC/USD')
+            side: Order side ('buy' or 'sell')
+            order_type: Order type (market, limit, stop-loss, etc.)
+            volume: Order volume in base currency
+            price: Limit price (required for limit orders)
+            rest_pair: Pair name for the REST fallback (default: symbol)
+            **params: Further add_order parameters of the WebSocket API
+                (e.g., post_only=True, cl_ord_id='...')
+        
+        Returns:
+            Order placement result with the order ID
+        
+        Raises:
+            ValueError: If the order has to fall back to REST and one of params
+                has no REST equivalent
+        """
+        side_str = getattr(side, "value", side)
+        ws_params = {
+            "order_type": getattr(order_type, "value", order_type),
+            "side": side_str,
+            "order_qty": Decimal(str(volume)),
+            "symbol": symbol
+        }
+        
+        if price is not None:
+            ws_params["limit_price"] = Decimal(str(price))
+        
+        ws_params.update(params)
+        
+        self.logger.info("📝 Placing %s order over WebSocket: %s %s @ %s", side_str, volume, symbol, price or 'market')
+        
+        try:
+            req_id, future = await self._send("add_order", ws_params)
+        except (OSError, websockets.WebSocketException) as e:
+            self.logger.warning("⚠️  WebSocket unavailable, placing order over REST: %s", e)
+            rest_kwargs = _rest_order_kwargs(price, params)
+            return await self.trader.add_order_async(rest_pair or symbol, side, order_type, volume, **rest_kwargs)
+        
+        try:
+            result = await self._result(req_id, future)
+            self.logger.info("✅ Order placed successfully. Order ID: %s", result.get('order_id'))
+            return result
+        except Exception as e:
+            self.logger.error("❌ Failed to place order: %s", e)
+            raise
+    
+    async def cancel_order(self, order_ids: List[str]) -> Dict[str, Any]:
+        """
+        Cancel one or more orders over the WebSocket connection.
+        
+        Args:
+            order_ids: Order transaction IDs
+        
+        Returns:
+            Cancellation result
+        """
+        if not order_ids:
+            raise ValueError("Must provide at least one order ID")
+        
+        self.logger.info("🗑️  Cancelling %s orders over WebSocket", len(order_ids))
+        
+        try:
+            req_id, future = await self._send("cancel_order", {"order_id": list(order_ids)})
+        except (OSError, websockets.WebSocketException) as e:
+            self.logger.warning("⚠️  WebSocket unavailable, cancelling over REST: %s", e)
+            return await asyncio.to_thread(self.trader.cancel_orders_batch, order_ids)
+        
+        try:
+            result = await self._result(req_id, future)
+            self.logger.info("✅ Orders cancelled successfully")
+            return result
+        except Exception as e:
+            self.logger.error("❌ Failed to cancel orders: %s", e)
+            raise
+    
+    async def close(self) -> None:
+        """Close the WebSocket connection."""
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+        
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        
+        self.logger.info("🔒 Kraken WebSocket trader closed")
+    
+    def __str__(self) -> str:
+        """String representation of the WebSocket trader."""
+        return f"KrakenWSTrader(connected={self._ws is not None}, timeout={self.timeout})"
@@ -59,3 +59,5 @@ class TraderManager:
         """Clean up resources."""
         if self.trader:
             self.trader.close()
+        if isinstance(self.portfolio, PortfolioSim):
+            self.portfolio.close()
@@ -0,0 +1,52 @@
+# shared/_balance_parse.py
+
+"""
+Balance parsing for Kraken Balance responses.
+
+Kept in its own fully annotated module with no dependencies on the rest of the
+package, so it can be compiled with mypyc (``mypyc shared/_balance_parse.py``)
+for accounts holding hundreds of assets. The pure-Python module is used as-is
+when no compiled build is present.
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Zero balances ("0.0000000000") contain no 1-9 digit and can be dropped before parsing
+_has_nonzero_digit: Callable[[str], Optional[Any]] = re.compile(r"[1-9]").search
+
+
+def parse_balances(raw_balances: Dict[str, Any]) -> Tuple[Dict[str, Decimal], List[Tuple[str, str, Exception]]]:
+    """
+    Convert raw Kraken balance strings into positive Decimal balances.
+
+    Args:
+        raw_balances: The 'result' mapping of a Balance response
+
+    Returns:
+        Tuple of (balances, failures): balances maps asset names to positive
+        Decimal amounts; failures lists (asset, raw value, error) for entries
+        that could not be parsed
+    """
+    balances: Dict[str, Decimal] = {}
+    failures: List[Tuple[str, str, Exception]] = []
+
+    for asset, raw in raw_balances.items():
+        balance_str: str = raw if isinstance(raw, str) else str(raw)
+
+        # Skip zero balances without constructing a Decimal
+        if not _has_nonzero_digit(balance_str):
+            continue
+
+        try:
+            balance = Decimal(balance_str)
+        except (ValueError, TypeError, InvalidOperation) as e:
+            failures.append((asset, balance_str, e))
+            continue
+
+        # Only include positive balances
+        if balance > 0:
+            balances[asset] = balance
+
+    return balances, failures
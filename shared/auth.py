@@ -2,12 +2,22 @@
 
 import time
 import base64
-import hashlib
+import binascii
+from hashlib import sha256 as _sha256
 import hmac
+import threading
 import urllib.parse
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from logger import Logger
 
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
 
 class KrakenAuth:
     """
@@ -17,6 +27,11 @@ class KrakenAuth:
     official authentication scheme: https://docs.kraken.com/rest/#section/Authentication
     """
     
+    __slots__ = (
+        "api_key", "api_secret", "logger", "_last_nonce", "_nonce_lock",
+        "_hmac_template", "_creds_valid", "_masked", "_path_cache"
+    )
+    
     def __init__(self, api_key: str, api_secret: str):
         """
         Initialize Kraken authentication.
@@ -33,6 +48,7 @@ class KrakenAuth:
             raise ValueError("API key and secret cannot be empty")
         
         self.api_key = api_key
+        self._masked = "***" if len(api_key) <= 8 else f"{api_key[:4]}***{api_key[-4:]}"
         
         try:
             self.api_secret = base64.b64decode(api_secret)
@@ -42,6 +58,19 @@ class KrakenAuth:
         self.logger = Logger(__name__, log_to_file=True)
         self._last_nonce = 0
         
+        # Serializes nonce generation across threads sharing this instance
+        self._nonce_lock = threading.Lock()
+        
+        # HMAC-SHA512 state keyed with the secret once; each signature copies it
+        # instead of re-deriving the inner/outer key pads
+        self._hmac_template = hmac.new(self.api_secret, digestmod="sha512")
+        
+        # Credential format check; both values are fixed for the object's lifetime
+        self._creds_valid = len(self.api_key) >= 10 and len(self.api_secret) >= 10
+        
+        # Encoded endpoint paths; callers sign the same handful of paths repeatedly
+        self._path_cache: Dict[str, bytes] = {}
+        
     def sign_request(self, url_path: str, data: Optional[Dict] = None) -> Dict[str, str]:
         """
         Creates signed headers for a Kraken API private request.
@@ -68,41 +97,92 @@ class KrakenAuth:
         
         try:
             # Create signature according to Kraken's specification
-            signature = self._create_signature(url_path, data)
+            signature = self._create_signature(url_path, data, nonce)
             
             headers = {
                 "API-Key": self.api_key,
                 "API-Sign": signature
             }
             
-            self.logger.debug(f"🔑 Signed request for {url_path} with nonce {nonce}")
+            self.logger.debug("🔑 Signed request for %s with nonce %s", url_path, nonce)
             return headers
             
         except Exception as e:
             self.logger.error(f"❌ Failed to sign request for {url_path}: {e}")
             raise
     
+    def sign_body(
+        self,
+        url_path: str,
+        data: Optional[Dict] = None,
+        json_body: bool = False
+    ) -> Tuple[Dict[str, str], bytes]:
+        """
+        Creates signed headers together with the encoded POST body.
+        
+        The body is encoded once and the signature is computed over those same
+        bytes, so callers can send the returned body as-is instead of having the
+        HTTP client encode the dict a second time.
+        
+        Args:
+            url_path: API endpoint path (e.g. "/0/private/AddOrder")
+            data: POST data payload as a dict (will be modified to add nonce)
+            json_body: Encode the body as JSON instead of URL encoding, for
+                endpoints taking list parameters (e.g. CancelOrderBatch)
+            
+        Returns:
+            Tuple of (headers, body): API-Key and API-Sign headers, and the
+            encoded POST body including the nonce
+            
+        Raises:
+            ValueError: If url_path is empty or invalid
+        """
+        if not url_path:
+            raise ValueError("URL path cannot be empty")
+        
+        if data is None:
+            data = {}
+        
+        nonce = self._generate_nonce()
+        data["nonce"] = nonce
+        
+        try:
+            if json_body:
+                body = _json_dumps(data)
+            else:
+                body = urllib.parse.urlencode(data).encode('ascii')
+            signature = self._sign_message(url_path, nonce.encode('ascii') + body)
+            
+            headers = {
+                "API-Key": self.api_key,
+                "API-Sign": signature
+            }
+            
+            self.logger.debug("🔑 Signed request for %s with nonce %s", url_path, nonce)
+            return headers, body
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to sign request for {url_path}: {e}")
+            raise
+    
     def _generate_nonce(self) -> str:
         """
         Generate a nonce (number used once) for API requests.
         
-        Kraken requires nonces to be increasing integers. Using microsecond
-        precision timestamp ensures uniqueness and proper ordering.
+        Kraken requires nonces to be increasing integers. The microsecond clock
+        keeps them in step with other clients on the same key; taking the last
+        nonce plus one when the clock has not moved past it keeps them unique
+        and ordered across bursts and clock adjustments.
         
         Returns:
             String representation of nonce
         """
-        # Use microsecond precision to ensure uniqueness
-        nonce = int(time.time() * 1_000_000)
-        
-        # Ensure nonce is always increasing (handle clock adjustments)
-        if nonce <= self._last_nonce:
-            nonce = self._last_nonce + 1
-        
-        self._last_nonce = nonce
+        with self._nonce_lock:
+            nonce = max(time.time_ns() // 1000, self._last_nonce + 1)
+            self._last_nonce = nonce
         return str(nonce)
     
-    def _create_signature(self, url_path: str, data: Dict) -> str:
+    def _create_signature(self, url_path: str, data: Dict, nonce: str) -> str:
         """
         Create HMAC-SHA512 signature for Kraken API request.
         
@@ -116,60 +196,62 @@ class KrakenAuth:
         Args:
             url_path: API endpoint path
             data: Request data including nonce
+            nonce: The nonce stored in data, as a string
             
         Returns:
             Base64 encoded signature
         """
-        # Get nonce as string
-        nonce = str(data["nonce"])
-        
-        # URL encode the POST data
-        post_data = urllib.parse.urlencode(data)
+        # Create message: nonce + URL encoded POST data. A nonce-only body (e.g.
+        # Balance) is just digits and needs no percent-encoding. Both forms are
+        # pure ASCII, so the cheaper ASCII encoder is used
+        if len(data) == 1 and "nonce" in data:
+            message = f"{nonce}nonce={nonce}".encode('ascii')
+        else:
+            message = (nonce + urllib.parse.urlencode(data)).encode('ascii')
         
-        # Create message: nonce + POST data
-        message = (nonce + post_data).encode('utf-8')
+        return self._sign_message(url_path, message)
+    
+    def _sign_message(self, url_path: str, message: bytes) -> str:
+        """
+        Sign an already assembled nonce + POST data message (steps 2-5 above).
         
+        Args:
+            url_path: API endpoint path
+            message: Nonce followed by the URL encoded POST data
+            
+        Returns:
+            Base64 encoded signature
+        """
         # Create SHA256 hash of the message
-        sha256_hash = hashlib.sha256(message).digest()
+        sha256_hash = _sha256(message).digest()
         
         # Concatenate URL path + SHA256 hash
-        path_bytes = url_path.encode('utf-8')
+        path_bytes = self._path_cache.get(url_path)
+        if path_bytes is None:
+            path_bytes = self._path_cache[url_path] = url_path.encode('utf-8')
         hmac_data = path_bytes + sha256_hash
         
-        # Create HMAC-SHA512 signature
-        signature = hmac.new(
-            self.api_secret,
-            hmac_data,
-            hashlib.sha512
-        ).digest()
+        # Create HMAC-SHA512 signature from the pre-keyed template
+        mac = self._hmac_template.copy()
+        mac.update(hmac_data)
+        signature = mac.digest()
         
-        # Base64 encode and return as string
-        return base64.b64encode(signature).decode('utf-8')
+        # Base64 encode and return as string (the output is always plain ASCII)
+        return binascii.b2a_base64(signature, newline=False).decode('ascii')
     
     def validate_credentials(self) -> bool:
         """
         Validate API credentials format (basic checks).
         
+        The base64 decoding of the secret is already verified in __init__, so the
+        result is computed once at construction.
+        
         Returns:
             True if credentials appear to have valid format
         """
-        try:
-            # Basic validation checks
-            if len(self.api_key) < 10:
-                return False
-            
-            if len(self.api_secret) < 10:
-                return False
-            
-            # Test if secret can be base64 decoded (already done in __init__)
-            return True
-            
-        except Exception:
-            return False
+        return self._creds_valid
     
     @property
     def masked_api_key(self) -> str:
         """Get API key with masked middle section for logging."""
-        if len(self.api_key) <= 8:
-            return "***"
-        return f"{self.api_key[:4]}***{self.api_key[-4:]}"
+        return self._masked
@@ -6,12 +6,21 @@ from the Kraken cryptocurrency exchange API.
 """
 
 import time
+import asyncio
 import logging
-from typing import Dict, Optional, Any
-from decimal import Decimal
+from typing import Dict, Optional, Any, Tuple
+from decimal import Decimal, ROUND_DOWN
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .auth import KrakenAuth
+from ._balance_parse import parse_balances
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    from json import loads as _json_loads
 
 
 class Portfolio:
@@ -25,23 +34,59 @@ class Portfolio:
     BASE_URL = "https://api.kraken.com"
     BALANCE_ENDPOINT = "/0/private/Balance"
     
-    def __init__(self, auth: KrakenAuth, timeout: int = 30):
+    # Kraken reports balances with at most 10 decimal places
+    BALANCE_SCALE = 10
+    
+    def __init__(self, auth: KrakenAuth, timeout: int = 30, cache_ttl: float = 1.0):
         """
         Initialize the Portfolio manager.
         
         Args:
             auth: KrakenAuth instance for API authentication
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Seconds a fetched set of balances is reused before the API
+                       is queried again; 0 disables caching (default: 1.0)
         """
         self.auth = auth
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        
+        # (monotonic fetch time, balances) of the last successful fetch
+        self._balances_cache: Optional[Tuple[float, Dict[str, Decimal]]] = None
         self.logger = logging.getLogger(__name__)
-        self._session = requests.Session()
+        self._session = self._create_session()
+        self._url = self.BASE_URL + self.BALANCE_ENDPOINT
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the HTTP session used for all Kraken requests.
+        
+        The session keeps its connection to the API host alive between calls and
+        carries the static request headers. Only failed connection attempts are
+        retried: a signed request that reached Kraken must not be replayed, since
+        its nonce has already been consumed.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1)
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "Kraken-Portfolio-Manager/1.0"
+        })
+        return session
         
     def get_balances(self) -> Dict[str, Decimal]:
         """
         Retrieve all account balances from Kraken.
         
+        Balances fetched less than cache_ttl seconds ago are returned without
+        another API call.
+        
         Returns:
             Dictionary mapping asset names to their balances as Decimal objects.
             Only returns assets with non-zero balances.
@@ -51,26 +96,22 @@ class Portfolio:
             ValueError: For invalid API responses
             Exception: For API errors returned by Kraken
         """
+        cached = self._balances_cache
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return dict(cached[1])
+        
         try:
-            # Prepare the request
-            nonce = str(int(time.time() * 1000))
-            data = {"nonce": nonce}
+            # Prepare the request; sign_request injects the nonce into data
+            data: Dict[str, str] = {}
             
             # Sign the request - get the headers dict
             auth_headers = self.auth.sign_request(self.BALANCE_ENDPOINT, data)
             
-            # Prepare headers
-            headers = {
-                **auth_headers,  # Include API-Key and API-Sign from auth
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": "Kraken-Portfolio-Manager/1.0"
-            }
-            
-            # Make the request
-            url = f"{self.BASE_URL}{self.BALANCE_ENDPOINT}"
+            # Make the request; static headers are set on the session, so only the
+            # auth headers are passed per call
             response = self._session.post(
-                url,
-                headers=headers,
+                self._url,
+                headers=auth_headers,
                 data=data,
                 timeout=self.timeout
             )
@@ -80,7 +121,7 @@ class Portfolio:
             
             # Parse JSON response
             try:
-                result = response.json()
+                result = _json_loads(response.content)
             except ValueError as e:
                 raise ValueError(f"Invalid JSON response from Kraken API: {e}")
             
@@ -98,19 +139,13 @@ class Portfolio:
                 raise ValueError("Expected 'result' to be a dictionary")
             
             # Convert to Decimal and filter out zero balances
-            balances = {}
-            for asset, balance_str in raw_balances.items():
-                try:
-                    balance = Decimal(str(balance_str))
-                    # Only include non-zero balances
-                    if balance > 0:
-                        balances[asset] = balance
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Could not parse balance for {asset}: {balance_str} - {e}")
-                    continue
+            balances, failures = parse_balances(raw_balances)
+            for asset, balance_str, e in failures:
+                self.logger.warning(f"Could not parse balance for {asset}: {balance_str} - {e}")
             
-            self.logger.info(f"Retrieved balances for {len(balances)} assets")
-            return balances
+            self.logger.info("Retrieved balances for %d assets", len(balances))
+            self._balances_cache = (time.monotonic(), balances)
+            return dict(balances)
             
         except requests.RequestException as e:
             self.logger.error(f"Network error retrieving balances: {e}")
@@ -119,6 +154,37 @@ class Portfolio:
             self.logger.error(f"Error retrieving balances: {e}")
             raise
     
+    async def get_balances_async(self) -> Dict[str, Decimal]:
+        """
+        Retrieve all account balances without blocking the event loop.
+        
+        The blocking request runs in a worker thread on the shared keep-alive
+        session, so several calls can be awaited together with asyncio.gather.
+        Concurrent private calls may reach Kraken out of nonce order; enable a
+        nonce window on the API key when overlapping them.
+        
+        Returns:
+            Dictionary mapping asset names to their balances as Decimal objects.
+            Only returns assets with non-zero balances.
+        """
+        return await asyncio.to_thread(self.get_balances)
+    
+    def get_balances_scaled(self) -> Dict[str, int]:
+        """
+        Retrieve all account balances as fixed-point integers.
+        
+        Each balance is expressed in units of 10**-BALANCE_SCALE, so amounts can be
+        added and compared with plain int arithmetic in hot paths.
+        
+        Returns:
+            Dictionary mapping asset names to their scaled integer balances.
+            Only returns assets with non-zero balances.
+        """
+        return {
+            asset: int(balance.scaleb(self.BALANCE_SCALE).to_integral_value(rounding=ROUND_DOWN))
+            for asset, balance in self.get_balances().items()
+        }
+    
     def get_balance(self, asset: str) -> Optional[Decimal]:
         """
         Get balance for a specific asset.
@@ -143,7 +209,8 @@ class Portfolio:
         Returns:
             GBP balance as Decimal, or None if no GBP balance exists
         """
-        return self.get_balance("GBP") or self.get_balance("ZGBP")
+        balances = self.get_balances()
+        return balances.get("GBP") or balances.get("ZGBP")
     
     def get_total_balance_usd(self) -> Optional[Decimal]:
         """
@@ -156,7 +223,8 @@ class Portfolio:
         Returns:
             USD balance as Decimal, or None if no USD balance exists
         """
-        return self.get_balance("USD") or self.get_balance("ZUSD")
+        balances = self.get_balances()
+        return balances.get("USD") or balances.get("ZUSD")
     
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """
@@ -169,14 +237,19 @@ class Portfolio:
             - timestamp: When the data was retrieved
         """
         balances = self.get_balances()
+        stringified = {asset: str(balance) for asset, balance in balances.items()}
         
         return {
-            "balances": {asset: str(balance) for asset, balance in balances.items()},
-            "asset_count": len(balances),
+            "balances": stringified,
+            "asset_count": len(stringified),
             "timestamp": time.time(),
-            "total_assets": list(balances.keys())
+            "total_assets": list(stringified)
         }
     
+    def invalidate_cache(self) -> None:
+        """Discard cached balances so the next call queries the API."""
+        self._balances_cache = None
+    
     def has_sufficient_balance(self, asset: str, required_amount: Decimal) -> bool:
         """
         Check if account has sufficient balance for a specific asset.
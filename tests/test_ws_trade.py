@@ -0,0 +1,162 @@
+"""
+Tests for the WebSocket order entry client, run against an in-memory fake socket.
+
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import asyncio
+import json
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from modules.trader.kraken.trade import OrderFlags
+from modules.trader.kraken.ws_trade import KrakenWSTrader
+
+
+class FakeWebSocket:
+    """In-memory WebSocket answering each request with respond(request)."""
+
+    def __init__(self, respond=None, fail_send: bool = False):
+        self.sent = []
+        self._respond = respond
+        self._fail_send = fail_send
+        self._incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        if self._fail_send:
+            raise OSError("send failed")
+
+        request = json.loads(message)
+        self.sent.append(request)
+        if self._respond is not None:
+            response = self._respond(request)
+            if response is not None:
+                self._incoming.put_nowait(json.dumps(response))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    async def close(self) -> None:
+        self._incoming.put_nowait(None)
+
+
+class FakeTrader:
+    """REST trader stand-in recording fallback calls."""
+
+    def __init__(self, token_error: bool = False):
+        self.token_error = token_error
+        self.rest_orders = []
+
+    def get_websockets_token(self) -> str:
+        if self.token_error:
+            raise Exception("Kraken API error: EAPI:Rate limit exceeded")
+        return "token"
+
+    async def add_order_async(self, *args, **kwargs):
+        self.rest_orders.append((args, kwargs))
+        return {"txid": ["REST-1"]}
+
+
+def _order_placed(request):
+    return {"method": "add_order", "req_id": request["req_id"], "success": True,
+            "result": {"order_id": "WS-1"}}
+
+
+def _order_rejected(request):
+    return {"method": "add_order", "req_id": request["req_id"], "success": False,
+            "error": "EOrder:Insufficient funds"}
+
+
+class KrakenWSTraderTest(unittest.IsolatedAsyncioTestCase):
+
+    async def _run(self, ws: FakeWebSocket, trader: FakeTrader = None, timeout: float = 1.0,
+                   **order):
+        """Place an order through a KrakenWSTrader connected to ws."""
+        ws_trader = KrakenWSTrader(trader or FakeTrader(), timeout=timeout)
+        connect = mock.AsyncMock(return_value=ws)
+        with mock.patch("modules.trader.kraken.ws_trade.websockets.connect", connect):
+            try:
+                return ws_trader, await ws_trader.add_order(**order)
+            finally:
+                self.addAsyncCleanup(ws_trader.close)
+
+    async def test_success_response_returns_result(self):
+        ws = FakeWebSocket(_order_placed)
+        ws_trader, result = await self._run(
+            ws, symbol="BTC/USD", side="buy", order_type="limit",
+            volume=Decimal("0.01"), price=Decimal("30000.10")
+        )
+
+        self.assertEqual(result, {"order_id": "WS-1"})
+        self.assertEqual(ws_trader._pending, {})
+
+        params = ws.sent[0]["params"]
+        self.assertEqual(ws.sent[0]["method"], "add_order")
+        self.assertEqual(params["token"], "token")
+        # Amounts keep their exact decimal form
+        self.assertEqual(params["order_qty"], "0.01")
+        self.assertEqual(params["limit_price"], "30000.10")
+
+    async def test_error_response_raises(self):
+        ws = FakeWebSocket(_order_rejected)
+        with self.assertRaisesRegex(Exception, "Insufficient funds"):
+            await self._run(ws, symbol="BTC/USD", side="buy", order_type="market", volume="0.01")
+
+    async def test_send_failure_falls_back_to_rest(self):
+        trader = FakeTrader()
+        ws = FakeWebSocket(fail_send=True)
+        _, result = await self._run(
+            ws, trader, symbol="BTC/USD", side="buy", order_type="limit", volume="0.01",
+            price="30000", rest_pair="XBTUSD", post_only=True, cl_ord_id="abc"
+        )
+
+        self.assertEqual(result, {"txid": ["REST-1"]})
+        args, kwargs = trader.rest_orders[0]
+        self.assertEqual(args, ("XBTUSD", "buy", "limit", "0.01"))
+        self.assertEqual(kwargs["price"], "30000")
+        self.assertEqual(kwargs["order_flags"], [OrderFlags.POST])
+        self.assertEqual(kwargs["client_order_id"], "abc")
+
+    async def test_token_failure_falls_back_to_rest(self):
+        trader = FakeTrader(token_error=True)
+        _, result = await self._run(
+            FakeWebSocket(_order_placed), trader,
+            symbol="BTC/USD", side="sell", order_type="market", volume="0.5"
+        )
+
+        self.assertEqual(result, {"txid": ["REST-1"]})
+        self.assertEqual(len(trader.rest_orders), 1)
+
+    async def test_unmappable_parameter_is_not_placed_over_rest(self):
+        trader = FakeTrader()
+        with self.assertRaises(ValueError):
+            await self._run(
+                FakeWebSocket(fail_send=True), trader,
+                symbol="BTC/USD", side="buy", order_type="limit", volume="1", price="10",
+                display_qty=0.1
+            )
+        self.assertEqual(trader.rest_orders, [])
+
+    async def test_timeout_drops_pending_request(self):
+        trader = FakeTrader()
+        ws_trader = KrakenWSTrader(trader, timeout=0.05)
+        self.addAsyncCleanup(ws_trader.close)
+        with mock.patch("modules.trader.kraken.ws_trade.websockets.connect",
+                        mock.AsyncMock(return_value=FakeWebSocket())):
+            with self.assertRaises(asyncio.TimeoutError):
+                await ws_trader.add_order("BTC/USD", "buy", "market", "0.01")
+
+        self.assertEqual(ws_trader._pending, {})
+        # A request that was sent is never replayed over REST
+        self.assertEqual(trader.rest_orders, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,9 @@ class DataStream:
         # Data storage: (symbol, timeframe) -> polars DataFrame
         self._candles_data: Dict[tuple, pl.DataFrame] = {}
         
+        # Running candle count per symbol across all timeframes
+        self._total_candles: Dict[str, int] = {}
+        
         # Symbol tracking: user_symbol -> pair_info
         self._tracked_symbols: Dict[str, Dict] = {}
         
@@ -50,6 +53,13 @@ class DataStream:
         """Add a callback for errors. Callback receives (symbol, error_message)"""
         self._error_callbacks.append(callback)
     
+    def _set_candles(self, key: tuple, df: pl.DataFrame):
+        """Store the data for a (symbol, timeframe) key and keep the symbol's candle count in step"""
+        previous = self._candles_data.get(key)
+        delta = len(df) - (len(previous) if previous is not None else 0)
+        self._total_candles[key[0]] = self._total_candles.get(key[0], 0) + delta
+        self._candles_data[key] = df
+    
     def _websocket_callback(self, channel: str, data: Dict):
         """Internal websocket callback that processes live data"""
         if channel == "ohlc" and 'data' in data and data['data']:
@@ -83,9 +93,9 @@ class DataStream:
             key = (symbol, '1m')
             if key in self._candles_data:
                 # Append new candle and maintain rolling window
-                self._candles_data[key] = pl.concat([self._candles_data[key], new_row]).tail(self._max_candles)
+                self._set_candles(key, pl.concat([self._candles_data[key], new_row]).tail(self._max_candles))
             else:
-                self._candles_data[key] = new_row
+                self._set_candles(key, new_row)
             
             # Notify callbacks
             for callback in self._data_callbacks:
@@ -161,14 +171,14 @@ class DataStream:
                 candles = ohlc_data[kraken_pair][-history_count:]
                 
                 key = (symbol, timeframe)
-                self._candles_data[key] = pl.DataFrame({
+                self._set_candles(key, pl.DataFrame({
                     'timestamp': [datetime.fromtimestamp(float(c[0])) for c in candles],
                     'open': [float(c[1]) for c in candles],
                     'high': [float(c[2]) for c in candles],
                     'low': [float(c[3]) for c in candles],
                     'close': [float(c[4]) for c in candles],
                     'volume': [float(c[6]) for c in candles]
-                })
+                }))
                 
                 print(f"Loaded {len(self._candles_data[key])} candles for {symbol} {timeframe}")
                 success_count += 1
@@ -262,6 +272,10 @@ class DataStream:
                 result[timeframe] = self._candles_data[key]
         return result
     
+    def get_total_candles(self, symbol: str) -> int:
+        """Get the number of candles held for a symbol across all timeframes"""
+        return self._total_candles.get(symbol.upper(), 0)
+    
     def get_loaded_timeframes(self, symbol: str) -> List[str]:
         """Get list of loaded timeframes for a symbol"""
         symbol = symbol.upper()